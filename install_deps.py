@@ -1,52 +1,75 @@
-#!/usr/bin/env python3
-"""
-Simple dependency installer for Morning Digest
-"""
-
-import subprocess
-import sys
-import os
-
-def install_package(package):
-    """Install a single package"""
-    try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-        return True
-    except subprocess.CalledProcessError:
-        return False
-
-def main():
-    print("Installing Morning Digest dependencies...")
-    
-    # Core dependencies needed for the orchestration system
-    core_deps = [
-        "anthropic>=0.7.0",
-        "aiohttp>=3.8.0", 
-        "feedparser>=6.0.0",
-        "tiktoken>=0.5.0",
-        "python-dateutil>=2.8.0",
-        "pyyaml>=6.0",
-        "jinja2>=3.1.0"
-    ]
-    
-    failed = []
-    
-    for dep in core_deps:
-        print(f"Installing {dep}...")
-        if install_package(dep):
-            print(f"  OK: {dep}")
-        else:
-            print(f"  FAILED: {dep}")
-            failed.append(dep)
-    
-    if failed:
-        print(f"\nFailed to install: {failed}")
-        print("You may need to install these manually:")
-        for dep in failed:
-            print(f"  pip install {dep}")
-    else:
-        print("\nAll dependencies installed successfully!")
-        print("You can now run: python -m src.main health")
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+Simple dependency installer for Morning Digest
+"""
+
+import subprocess
+import sys
+import os
+
+PIP_ENV = {
+    **os.environ,
+    "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+    "PYTHONDONTWRITEBYTECODE": "1",
+}
+
+def install_packages(packages):
+    """Install packages with a single pip invocation"""
+    result = subprocess.run(
+        [sys.executable, "-m", "pip", "install",
+         "--disable-pip-version-check", "--no-input", *packages],
+        check=False, capture_output=True, text=True, env=PIP_ENV
+    )
+    return result.returncode == 0, result.stderr
+
+def install_package(package):
+    """Install a single package; returns (success, pip's stderr)"""
+    return install_packages([package])
+
+def main():
+    print("Installing Morning Digest dependencies...")
+    
+    # Core dependencies needed for the orchestration system
+    core_deps = [
+        "anthropic>=0.25.0",
+        "aiohttp>=3.8.0", 
+        "feedparser>=6.0.0",
+        "tiktoken>=0.5.0",
+        "python-dateutil>=2.8.0",
+        "pyyaml>=6.0",
+        "jinja2>=3.1.0"
+    ]
+    
+    failed = []
+    
+    print(f"Installing {len(core_deps)} packages...")
+    ok, _ = install_packages(core_deps)
+    if ok:
+        for dep in core_deps:
+            print(f"  OK: {dep}")
+    else:
+        # Batch install failed; retry individually to find the culprits. One
+        # at a time: concurrent pip runs into the same site-packages can
+        # overwrite each other's files (pip does no locking)
+        print("  Batch install failed, retrying packages individually...")
+        results = [install_package(dep) for dep in core_deps]
+        for dep, (installed, stderr) in zip(core_deps, results):
+            if installed:
+                print(f"  OK: {dep}")
+            else:
+                print(f"  FAILED: {dep}")
+                if stderr:
+                    print(stderr)
+                failed.append(dep)
+    
+    if failed:
+        print(f"\nFailed to install: {failed}")
+        print("You may need to install these manually:")
+        for dep in failed:
+            print(f"  pip install {dep}")
+    else:
+        print("\nAll dependencies installed successfully!")
+        print("You can now run: python -m src.main health")
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,190 +1,242 @@
-#!/usr/bin/env python3
-"""
-Basic test runner that demonstrates the orchestration system works
-without requiring all external dependencies.
-"""
-
-import sys
-import os
-import json
-from datetime import datetime
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-def run_basic_test():
-    """Test basic functionality without external dependencies"""
-    
-    print("🧪 Norwegian Morning Digest - Basic System Test")
-    print("="*60)
-    
-    try:
-        # Test 1: Check file structure
-        print("1. Checking file structure...")
-        required_files = [
-            'src/orchestration/digest_orchestrator.py',
-            'src/orchestration/agent_coordinator.py', 
-            'src/main.py',
-            'requirements.txt'
-        ]
-        
-        for file_path in required_files:
-            if os.path.exists(file_path):
-                print(f"   ✅ {file_path}")
-            else:
-                print(f"   ❌ {file_path} MISSING")
-                return False
-        
-        # Test 2: Check syntax validation
-        print("\n2. Checking Python syntax...")
-        import py_compile
-        
-        syntax_files = [
-            'src/orchestration/digest_orchestrator.py',
-            'src/orchestration/agent_coordinator.py',
-            'src/main.py'
-        ]
-        
-        for file_path in syntax_files:
-            try:
-                py_compile.compile(file_path, doraise=True)
-                print(f"   ✅ {file_path} - Valid syntax")
-            except py_compile.PyCompileError as e:
-                print(f"   ❌ {file_path} - Syntax error: {e}")
-                return False
-        
-        # Test 3: Check architecture design
-        print("\n3. Checking architecture design...")
-        
-        # Read and validate orchestrator structure
-        with open('src/orchestration/digest_orchestrator.py', 'r') as f:
-            orchestrator_content = f.read()
-        
-        key_components = [
-            'class DigestOrchestrator',
-            'async def generate_morning_digest',
-            '_collect_all_data',
-            '_initialize_collectors',
-            'Norwegian context',
-            'graceful degradation'
-        ]
-        
-        for component in key_components:
-            if component in orchestrator_content:
-                print(f"   ✅ {component} - Found in orchestrator")
-            else:
-                print(f"   ⚠️  {component} - Not found in orchestrator")
-        
-        # Test 4: Check Norwegian context integration  
-        print("\n4. Checking Norwegian context integration...")
-        
-        norwegian_elements = [
-            'Trondheim',
-            'Norwegian', 
-            'boys aged 5',
-            'restaurant',
-            'ML engineer'
-        ]
-        
-        for element in norwegian_elements:
-            if element in orchestrator_content:
-                print(f"   ✅ {element} - Norwegian context found")
-            else:
-                print(f"   ⚠️  {element} - Norwegian context element missing")
-        
-        # Test 5: Check CLI interface
-        print("\n5. Checking CLI interface...")
-        
-        with open('src/main.py', 'r') as f:
-            main_content = f.read()
-        
-        cli_features = [
-            'generate',
-            'health', 
-            'status',
-            'test-agents',
-            'send-email'
-        ]
-        
-        for feature in cli_features:
-            if f"'{feature}'" in main_content or f'"{feature}"' in main_content:
-                print(f"   ✅ {feature} - CLI command available")
-            else:
-                print(f"   ⚠️  {feature} - CLI command missing")
-        
-        # Test 6: Check error handling
-        print("\n6. Checking error handling...")
-        
-        error_handling_features = [
-            'try:',
-            'except',
-            'ErrorHandler',
-            'graceful',
-            'fallback'
-        ]
-        
-        total_error_features = 0
-        for feature in error_handling_features:
-            count = orchestrator_content.count(feature)
-            total_error_features += count
-            if count > 0:
-                print(f"   ✅ {feature} - Found {count} times")
-            else:
-                print(f"   ⚠️  {feature} - Not found")
-        
-        print(f"   📊 Total error handling features: {total_error_features}")
-        
-        # Test 7: Check async architecture
-        print("\n7. Checking async architecture...")
-        
-        async_features = [
-            'async def',
-            'await',
-            'asyncio',
-            'gather'
-        ]
-        
-        for feature in async_features:
-            count = orchestrator_content.count(feature)
-            if count > 0:
-                print(f"   ✅ {feature} - Found {count} times")
-            else:
-                print(f"   ⚠️  {feature} - Not found")
-        
-        # Final assessment
-        print("\n🎉 Test Results Summary:")
-        print("="*60)
-        print("✅ File structure: Complete")
-        print("✅ Python syntax: Valid")  
-        print("✅ Architecture design: Implemented")
-        print("✅ Norwegian context: Integrated")
-        print("✅ CLI interface: Complete")
-        print("✅ Error handling: Comprehensive")
-        print("✅ Async architecture: Implemented")
-        
-        print("\n📋 System Status:")
-        print("🏗️  Core orchestration system: READY")
-        print("🤖 AI agent coordination: IMPLEMENTED")
-        print("🇳🇴 Norwegian context: CONFIGURED")
-        print("⚡ Async performance: ENABLED")
-        print("🛡️  Error resilience: BUILT-IN")
-        print("🖥️  CLI interface: FUNCTIONAL")
-        
-        print("\n🚀 Next Steps for Full Operation:")
-        print("1. Install dependencies: pip install -r requirements.txt")
-        print("2. Configure API keys in config/settings.yaml")
-        print("3. Run system: python -m src.main health")
-        print("4. Generate digest: python -m src.main generate")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Test failed with error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-if __name__ == "__main__":
-    success = run_basic_test()
-    print(f"\n{'🎉 ALL TESTS PASSED' if success else '❌ TESTS FAILED'}")
+#!/usr/bin/env python3
+"""
+Basic test runner that demonstrates the orchestration system works
+without requiring all external dependencies.
+"""
+
+import sys
+import os
+import re
+import mmap
+import json
+from collections import Counter, defaultdict
+from datetime import datetime
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+def map_source(file_path):
+    """Memory-map a source file read-only so it can be searched as bytes"""
+    with open(file_path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def count_needles(content, needles):
+    """Count occurrences of every needle in a single pass over a bytes buffer"""
+    # Longest needles first so e.g. 'graceful degradation' wins over 'graceful'
+    ordered = sorted(set(needles), key=len, reverse=True)
+    encoded = {n.encode('utf-8'): n for n in ordered}
+    pattern = re.compile(b'|'.join(re.escape(b) for b in encoded))
+    # A match on a longer needle also counts the needles it contains
+    contained = {b: [(o, encoded[b].count(o)) for o in ordered if o in encoded[b]]
+                 for b in encoded}
+    counts = Counter()
+    for match in pattern.finditer(content):
+        for needle, hits in contained[match.group()]:
+            counts[needle] += hits
+    return counts
+
+def run_basic_test():
+    """Test basic functionality without external dependencies"""
+    
+    print("🧪 Norwegian Morning Digest - Basic System Test")
+    print("="*60)
+    
+    try:
+        # Test 1: Check file structure
+        print("1. Checking file structure...")
+        required_files = [
+            'src/orchestration/digest_orchestrator.py',
+            'src/orchestration/agent_coordinator.py', 
+            'src/main.py',
+            'requirements.txt'
+        ]
+        
+        # One directory listing per parent instead of a stat() per file
+        files_by_dir = defaultdict(set)
+        for file_path in required_files:
+            directory, name = os.path.split(file_path)
+            files_by_dir[directory].add(name)
+        
+        present = set()
+        for directory, names in files_by_dir.items():
+            try:
+                with os.scandir(directory or '.') as entries:
+                    present.update(
+                        os.path.join(directory, entry.name)
+                        for entry in entries if entry.name in names
+                    )
+            except FileNotFoundError:
+                pass
+        
+        for file_path in required_files:
+            if file_path in present:
+                print(f"   ✅ {file_path}")
+            else:
+                print(f"   ❌ {file_path} MISSING")
+                return False
+        
+        # Test 2: Check syntax validation
+        print("\n2. Checking Python syntax...")
+        
+        syntax_files = [
+            'src/orchestration/digest_orchestrator.py',
+            'src/orchestration/agent_coordinator.py',
+            'src/main.py'
+        ]
+        
+        for file_path in syntax_files:
+            try:
+                # Parse in-process; no .pyc is written to __pycache__
+                with open(file_path, 'rb') as f:
+                    source = f.read()
+                compile(source, file_path, 'exec')
+                print(f"   ✅ {file_path} - Valid syntax")
+            except SyntaxError as e:
+                print(f"   ❌ {file_path} - Syntax error: {e}")
+                return False
+        
+        # Test 3: Check architecture design
+        print("\n3. Checking architecture design...")
+        
+        # Read and validate orchestrator structure
+        orchestrator_content = map_source('src/orchestration/digest_orchestrator.py')
+        
+        key_components = [
+            'class DigestOrchestrator',
+            'async def generate_morning_digest',
+            '_collect_all_data',
+            '_initialize_collectors',
+            'Norwegian context',
+            'graceful degradation'
+        ]
+        
+        norwegian_elements = [
+            'Trondheim',
+            'Norwegian', 
+            'boys aged 5',
+            'restaurant',
+            'ML engineer'
+        ]
+        
+        error_handling_features = [
+            'try:',
+            'except',
+            'ErrorHandler',
+            'graceful',
+            'fallback'
+        ]
+        
+        async_features = [
+            'async def',
+            'await',
+            'asyncio',
+            'gather'
+        ]
+        
+        # Scan the orchestrator once for every check in tests 3, 4, 6 and 7
+        orchestrator_counts = count_needles(
+            orchestrator_content,
+            key_components + norwegian_elements
+            + error_handling_features + async_features
+        )
+        orchestrator_content.close()
+        
+        for component in key_components:
+            if orchestrator_counts[component]:
+                print(f"   ✅ {component} - Found in orchestrator")
+            else:
+                print(f"   ⚠️  {component} - Not found in orchestrator")
+        
+        # Test 4: Check Norwegian context integration  
+        print("\n4. Checking Norwegian context integration...")
+        
+        for element in norwegian_elements:
+            if orchestrator_counts[element]:
+                print(f"   ✅ {element} - Norwegian context found")
+            else:
+                print(f"   ⚠️  {element} - Norwegian context element missing")
+        
+        # Test 5: Check CLI interface
+        print("\n5. Checking CLI interface...")
+        
+        main_content = map_source('src/main.py')
+        
+        cli_features = [
+            'generate',
+            'health', 
+            'status',
+            'test-agents',
+            'send-email'
+        ]
+        
+        for feature in cli_features:
+            needle = feature.encode('utf-8')
+            if (main_content.find(b"'" + needle + b"'") != -1
+                    or main_content.find(b'"' + needle + b'"') != -1):
+                print(f"   ✅ {feature} - CLI command available")
+            else:
+                print(f"   ⚠️  {feature} - CLI command missing")
+        
+        main_content.close()
+        
+        # Test 6: Check error handling
+        print("\n6. Checking error handling...")
+        
+        total_error_features = 0
+        for feature in error_handling_features:
+            count = orchestrator_counts[feature]
+            total_error_features += count
+            if count > 0:
+                print(f"   ✅ {feature} - Found {count} times")
+            else:
+                print(f"   ⚠️  {feature} - Not found")
+        
+        print(f"   📊 Total error handling features: {total_error_features}")
+        
+        # Test 7: Check async architecture
+        print("\n7. Checking async architecture...")
+        
+        for feature in async_features:
+            count = orchestrator_counts[feature]
+            if count > 0:
+                print(f"   ✅ {feature} - Found {count} times")
+            else:
+                print(f"   ⚠️  {feature} - Not found")
+        
+        # Final assessment
+        print("\n🎉 Test Results Summary:")
+        print("="*60)
+        print("✅ File structure: Complete")
+        print("✅ Python syntax: Valid")  
+        print("✅ Architecture design: Implemented")
+        print("✅ Norwegian context: Integrated")
+        print("✅ CLI interface: Complete")
+        print("✅ Error handling: Comprehensive")
+        print("✅ Async architecture: Implemented")
+        
+        print("\n📋 System Status:")
+        print("🏗️  Core orchestration system: READY")
+        print("🤖 AI agent coordination: IMPLEMENTED")
+        print("🇳🇴 Norwegian context: CONFIGURED")
+        print("⚡ Async performance: ENABLED")
+        print("🛡️  Error resilience: BUILT-IN")
+        print("🖥️  CLI interface: FUNCTIONAL")
+        
+        print("\n🚀 Next Steps for Full Operation:")
+        print("1. Install dependencies: pip install -r requirements.txt")
+        print("2. Configure API keys in config/settings.yaml")
+        print("3. Run system: python -m src.main health")
+        print("4. Generate digest: python -m src.main generate")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+if __name__ == "__main__":
+    success = run_basic_test()
+    print(f"\n{'🎉 ALL TESTS PASSED' if success else '❌ TESTS FAILED'}")
     sys.exit(0 if success else 1)
\ No newline at end of file
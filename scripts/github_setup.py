@@ -9,7 +9,8 @@ import sys
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 def setup_logging():
     """Setup logging for the script."""
@@ -18,163 +19,69 @@ def setup_logging():
         format='%(asctime)s - %(levelname)s - %(message)s'
     )
 
-class GitHubSetupHelper:
-    """Helper class for GitHub repository setup."""
-    
-    def __init__(self):
-        self.logger = logging.getLogger('GitHubSetup')
-        
-    def check_github_cli(self) -> bool:
-        """Check if GitHub CLI is installed and authenticated."""
-        try:
-            import subprocess
-            result = subprocess.run(['gh', 'auth', 'status'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                self.logger.info("✅ GitHub CLI is installed and authenticated")
-                return True
-            else:
-                self.logger.error("❌ GitHub CLI authentication failed")
-                self.logger.error("Run: gh auth login")
-                return False
-        except FileNotFoundError:
-            self.logger.error("❌ GitHub CLI not found")
-            self.logger.error("Install from: https://cli.github.com/")
-            return False
-        except Exception as e:
-            self.logger.error(f"❌ Error checking GitHub CLI: {e}")
-            return False
-    
-    def get_required_secrets(self) -> Dict[str, Dict[str, str]]:
-        """Get list of required GitHub secrets with descriptions."""
-        return {
-            "CLAUDE_API_KEY": {
-                "description": "Claude API key from Anthropic",
-                "example": "sk-ant-api03-...",
-                "required": True,
-                "source": "https://console.anthropic.com/"
-            },
-            "GMAIL_ADDRESS": {
-                "description": "Gmail address for sending digest emails",
-                "example": "your-email@gmail.com",
-                "required": True,
-                "source": "Your Gmail account"
-            },
-            "GMAIL_APP_PASSWORD": {
-                "description": "Gmail app password (not regular password)",
-                "example": "xxxx xxxx xxxx xxxx",
-                "required": True,
-                "source": "Gmail > Security > App Passwords"
-            },
-            "RECIPIENT_EMAIL": {
-                "description": "Email address to receive digest (optional, defaults to GMAIL_ADDRESS)",
-                "example": "recipient@example.com",
-                "required": False,
-                "source": "Any valid email address"
-            },
-            "OPENWEATHER_API_KEY": {
-                "description": "OpenWeather API key for weather data (optional)",
-                "example": "abcd1234...",
-                "required": False,
-                "source": "https://openweathermap.org/api"
-            }
-        }
-    
-    def get_repository_variables(self) -> Dict[str, Dict[str, str]]:
-        """Get list of repository variables (non-sensitive configuration)."""
-        return {
-            "TOKEN_BUDGET": {
-                "description": "Daily Claude API token budget",
-                "default": "10000",
-                "example": "15000"
-            },
-            "HOURLY_TOKEN_LIMIT": {
-                "description": "Hourly token usage limit",
-                "default": "2000",
-                "example": "3000"
-            },
-            "LOG_LEVEL": {
-                "description": "Logging level for the application",
-                "default": "INFO",
-                "example": "DEBUG"
-            },
-            "LOCATION": {
-                "description": "Location for weather and local context",
-                "default": "Trondheim, Norway",
-                "example": "Oslo, Norway"
-            },
-            "TIMEZONE": {
-                "description": "Timezone for scheduling and timestamps",
-                "default": "Europe/Oslo",
-                "example": "Europe/Oslo"
-            }
-        }
-    
-    def print_secrets_setup_guide(self):
-        """Print detailed guide for setting up GitHub secrets."""
-        secrets = self.get_required_secrets()
-        
-        self.logger.info("🔐 GitHub Secrets Setup Guide")
-        self.logger.info("=" * 50)
-        
-        self.logger.info("\n1. Go to your GitHub repository")
-        self.logger.info("2. Navigate to Settings > Secrets and variables > Actions")
-        self.logger.info("3. Click 'New repository secret' for each required secret:")
-        
-        for secret_name, info in secrets.items():
-            status = "REQUIRED" if info["required"] else "OPTIONAL"
-            self.logger.info(f"\n   📋 {secret_name} ({status})")
-            self.logger.info(f"      Description: {info['description']}")
-            self.logger.info(f"      Example: {info['example']}")
-            self.logger.info(f"      Source: {info['source']}")
-    
-    def print_variables_setup_guide(self):
-        """Print guide for setting up repository variables."""
-        variables = self.get_repository_variables()
-        
-        self.logger.info("\n⚙️ GitHub Variables Setup Guide")
-        self.logger.info("=" * 50)
-        
-        self.logger.info("\n1. Go to your GitHub repository")
-        self.logger.info("2. Navigate to Settings > Secrets and variables > Actions")
-        self.logger.info("3. Click the 'Variables' tab")
-        self.logger.info("4. Click 'New repository variable' for each configuration:")
-        
-        for var_name, info in variables.items():
-            self.logger.info(f"\n   🔧 {var_name}")
-            self.logger.info(f"      Description: {info['description']}")
-            self.logger.info(f"      Default: {info['default']}")
-            self.logger.info(f"      Example: {info['example']}")
-    
-    def generate_setup_commands(self) -> List[str]:
-        """Generate GitHub CLI commands for setting up secrets."""
-        commands = []
-        secrets = self.get_required_secrets()
-        
-        commands.append("# GitHub CLI commands to set secrets:")
-        commands.append("# Replace <value> with your actual values")
-        commands.append("")
-        
-        for secret_name, info in secrets.items():
-            if info["required"]:
-                commands.append(f"gh secret set {secret_name} --body '<your_{secret_name.lower()}>'")
-            else:
-                commands.append(f"# Optional: gh secret set {secret_name} --body '<your_{secret_name.lower()}>'")
-        
-        commands.append("")
-        commands.append("# GitHub CLI commands to set variables:")
-        variables = self.get_repository_variables()
-        
-        for var_name, info in variables.items():
-            commands.append(f"gh variable set {var_name} --body '{info['default']}'")
-        
-        return commands
-    
-    def create_setup_script(self):
-        """Create a shell script for easy GitHub setup."""
-        commands = self.generate_setup_commands()
-        
-        script_content = """#!/bin/bash
+# Static setup data, shared read-only across helper instances
+_REQUIRED_SECRETS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "CLAUDE_API_KEY": MappingProxyType({
+        "description": "Claude API key from Anthropic",
+        "example": "sk-ant-api03-...",
+        "required": True,
+        "source": "https://console.anthropic.com/"
+    }),
+    "GMAIL_ADDRESS": MappingProxyType({
+        "description": "Gmail address for sending digest emails",
+        "example": "your-email@gmail.com",
+        "required": True,
+        "source": "Your Gmail account"
+    }),
+    "GMAIL_APP_PASSWORD": MappingProxyType({
+        "description": "Gmail app password (not regular password)",
+        "example": "xxxx xxxx xxxx xxxx",
+        "required": True,
+        "source": "Gmail > Security > App Passwords"
+    }),
+    "RECIPIENT_EMAIL": MappingProxyType({
+        "description": "Email address to receive digest (optional, defaults to GMAIL_ADDRESS)",
+        "example": "recipient@example.com",
+        "required": False,
+        "source": "Any valid email address"
+    }),
+    "OPENWEATHER_API_KEY": MappingProxyType({
+        "description": "OpenWeather API key for weather data (optional)",
+        "example": "abcd1234...",
+        "required": False,
+        "source": "https://openweathermap.org/api"
+    })
+})
+
+_REPOSITORY_VARIABLES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "TOKEN_BUDGET": MappingProxyType({
+        "description": "Daily Claude API token budget",
+        "default": "10000",
+        "example": "15000"
+    }),
+    "HOURLY_TOKEN_LIMIT": MappingProxyType({
+        "description": "Hourly token usage limit",
+        "default": "2000",
+        "example": "3000"
+    }),
+    "LOG_LEVEL": MappingProxyType({
+        "description": "Logging level for the application",
+        "default": "INFO",
+        "example": "DEBUG"
+    }),
+    "LOCATION": MappingProxyType({
+        "description": "Location for weather and local context",
+        "default": "Trondheim, Norway",
+        "example": "Oslo, Norway"
+    }),
+    "TIMEZONE": MappingProxyType({
+        "description": "Timezone for scheduling and timestamps",
+        "default": "Europe/Oslo",
+        "example": "Europe/Oslo"
+    })
+})
+
+_SETUP_SCRIPT_HEADER = """#!/bin/bash
 # GitHub Setup Script for Morning Digest
 # This script helps you set up the required secrets and variables
 
@@ -258,20 +165,12 @@ echo "Setting up GitHub Secrets..."
 echo "============================"
 """
 
-        secrets = self.get_required_secrets()
-        for secret_name, info in secrets.items():
-            script_content += f'set_secret "{secret_name}" "{info["description"]}" "{str(info["required"]).lower()}"\n'
-        
-        script_content += '''
+_SETUP_SCRIPT_VARIABLES_HEADER = '''
 echo "Setting up GitHub Variables..."
 echo "=============================="
 '''
-        
-        variables = self.get_repository_variables()
-        for var_name, info in variables.items():
-            script_content += f'set_variable "{var_name}" "{info["description"]}" "{info["default"]}"\n'
-        
-        script_content += '''
+
+_SETUP_SCRIPT_FOOTER = '''
 echo "🎉 GitHub setup completed!"
 echo ""
 echo "Next steps:"
@@ -279,9 +178,124 @@ echo "1. Verify your secrets and variables in GitHub repository settings"
 echo "2. Test the workflow with: gh workflow run daily-digest.yml --ref main"
 echo "3. Check the workflow results in the Actions tab"
 '''
+
+class GitHubSetupHelper:
+    """Helper class for GitHub repository setup."""
+    
+    def __init__(self):
+        self.logger = logging.getLogger('GitHubSetup')
+        
+    def check_github_cli(self) -> bool:
+        """Check if GitHub CLI is installed and authenticated."""
+        try:
+            import subprocess
+            result = subprocess.run(['gh', 'auth', 'status'], 
+                                  capture_output=True, text=True)
+            if result.returncode == 0:
+                self.logger.info("✅ GitHub CLI is installed and authenticated")
+                return True
+            else:
+                self.logger.error("❌ GitHub CLI authentication failed")
+                self.logger.error("Run: gh auth login")
+                return False
+        except FileNotFoundError:
+            self.logger.error("❌ GitHub CLI not found")
+            self.logger.error("Install from: https://cli.github.com/")
+            return False
+        except Exception as e:
+            self.logger.error(f"❌ Error checking GitHub CLI: {e}")
+            return False
+    
+    def get_required_secrets(self) -> Mapping[str, Mapping[str, Any]]:
+        """Get list of required GitHub secrets with descriptions."""
+        return _REQUIRED_SECRETS
+    
+    def get_repository_variables(self) -> Mapping[str, Mapping[str, str]]:
+        """Get list of repository variables (non-sensitive configuration)."""
+        return _REPOSITORY_VARIABLES
+    
+    def print_secrets_setup_guide(self):
+        """Print detailed guide for setting up GitHub secrets."""
+        lines = []
+        secrets = self.get_required_secrets()
+        
+        lines.append("🔐 GitHub Secrets Setup Guide")
+        lines.append("=" * 50)
+        
+        lines.append("\n1. Go to your GitHub repository")
+        lines.append("2. Navigate to Settings > Secrets and variables > Actions")
+        lines.append("3. Click 'New repository secret' for each required secret:")
+        
+        for secret_name, info in secrets.items():
+            status = "REQUIRED" if info["required"] else "OPTIONAL"
+            lines.append(f"\n   📋 {secret_name} ({status})")
+            lines.append(f"      Description: {info['description']}")
+            lines.append(f"      Example: {info['example']}")
+            lines.append(f"      Source: {info['source']}")
+        
+        self.logger.info("\n".join(lines))
+    
+    def print_variables_setup_guide(self):
+        """Print guide for setting up repository variables."""
+        lines = []
+        variables = self.get_repository_variables()
+        
+        lines.append("\n⚙️ GitHub Variables Setup Guide")
+        lines.append("=" * 50)
+        
+        lines.append("\n1. Go to your GitHub repository")
+        lines.append("2. Navigate to Settings > Secrets and variables > Actions")
+        lines.append("3. Click the 'Variables' tab")
+        lines.append("4. Click 'New repository variable' for each configuration:")
+        
+        for var_name, info in variables.items():
+            lines.append(f"\n   🔧 {var_name}")
+            lines.append(f"      Description: {info['description']}")
+            lines.append(f"      Default: {info['default']}")
+            lines.append(f"      Example: {info['example']}")
+        
+        self.logger.info("\n".join(lines))
+    
+    def generate_setup_commands(self) -> List[str]:
+        """Generate GitHub CLI commands for setting up secrets."""
+        commands = []
+        secrets = self.get_required_secrets()
+        
+        commands.append("# GitHub CLI commands to set secrets:")
+        commands.append("# Replace <value> with your actual values")
+        commands.append("")
+        
+        for secret_name, info in secrets.items():
+            if info["required"]:
+                commands.append(f"gh secret set {secret_name} --body '<your_{secret_name.lower()}>'")
+            else:
+                commands.append(f"# Optional: gh secret set {secret_name} --body '<your_{secret_name.lower()}>'")
+        
+        commands.append("")
+        commands.append("# GitHub CLI commands to set variables:")
+        variables = self.get_repository_variables()
+        
+        for var_name, info in variables.items():
+            commands.append(f"gh variable set {var_name} --body '{info['default']}'")
+        
+        return commands
+    
+    def create_setup_script(self):
+        """Create a shell script for easy GitHub setup."""
+        parts = [_SETUP_SCRIPT_HEADER]
+        parts.extend(
+            f'set_secret "{secret_name}" "{info["description"]}" "{str(info["required"]).lower()}"\n'
+            for secret_name, info in self.get_required_secrets().items()
+        )
+        parts.append(_SETUP_SCRIPT_VARIABLES_HEADER)
+        parts.extend(
+            f'set_variable "{var_name}" "{info["description"]}" "{info["default"]}"\n'
+            for var_name, info in self.get_repository_variables().items()
+        )
+        parts.append(_SETUP_SCRIPT_FOOTER)
         
         script_path = Path("scripts/github_setup.sh")
-        script_path.write_text(script_content)
+        script_path.write_text("".join(parts))
         os.chmod(script_path, 0o755)
         
         self.logger.info(f"✅ Created interactive setup script: {script_path}")
@@ -296,30 +310,32 @@ echo "3. Check the workflow results in the Actions tab"
             return False
         
         try:
-            import yaml
-            content = yaml.safe_load(workflow_path.read_text())
+            # Only top-level keys are checked, so a line scan is enough and
+            # avoids a full YAML parse (which would also read `on:` as True)
+            top_level_keys = {
+                line.split(':', 1)[0].strip('\'"')
+                for line in workflow_path.read_text().splitlines()
+                if line and not line[0].isspace() and not line.startswith('#') and ':' in line
+            }
             
             required_keys = ['name', 'on', 'jobs']
             for key in required_keys:
-                if key not in content:
+                if key not in top_level_keys:
                     self.logger.error(f"❌ Missing required key in workflow: {key}")
                     return False
             
             self.logger.info("✅ Workflow file is valid")
             return True
             
-        except ImportError:
-            # PyYAML not installed, skip validation
-            self.logger.info("⚠️  PyYAML not available, skipping workflow validation")
-            return True
         except Exception as e:
             self.logger.error(f"❌ Error validating workflow file: {e}")
             return False
     
     def print_final_instructions(self):
         """Print final setup instructions."""
-        self.logger.info("\n🎯 Final Setup Instructions")
-        self.logger.info("=" * 50)
+        lines = []
+        lines.append("\n🎯 Final Setup Instructions")
+        lines.append("=" * 50)
         
         instructions = [
             "1. Set up GitHub secrets and variables (see guides above)",
@@ -335,12 +351,14 @@ echo "3. Check the workflow results in the Actions tab"
         ]
         
         for instruction in instructions:
-            self.logger.info(f"   {instruction}")
+            lines.append(f"   {instruction}")
+        
+        lines.append("\n📚 Additional Resources:")
+        lines.append("   - GitHub Actions docs: https://docs.github.com/en/actions")
+        lines.append("   - GitHub CLI docs: https://cli.github.com/manual/")
+        lines.append("   - Workflow troubleshooting: Check Actions tab for logs")
         
-        self.logger.info("\n📚 Additional Resources:")
-        self.logger.info("   - GitHub Actions docs: https://docs.github.com/en/actions")
-        self.logger.info("   - GitHub CLI docs: https://cli.github.com/manual/")
-        self.logger.info("   - Workflow troubleshooting: Check Actions tab for logs")
+        self.logger.info("\n".join(lines))
 
 def main():
     """Main setup function."""
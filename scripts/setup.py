@@ -7,6 +7,8 @@ Creates necessary directories, validates configuration, and sets up the environm
 import os
 import sys
 import logging
+import compileall
+from importlib.metadata import distribution, PackageNotFoundError
 from pathlib import Path
 from typing import List, Tuple
 
@@ -31,12 +33,13 @@ def create_directories() -> List[str]:
     created = []
     for directory in directories:
         dir_path = Path(directory)
-        if not dir_path.exists():
-            dir_path.mkdir(parents=True, exist_ok=True)
-            created.append(str(dir_path))
-            logging.info(f"Created directory: {directory}")
-        else:
+        if dir_path.is_dir():
             logging.info(f"Directory already exists: {directory}")
+            continue
+        # exist_ok still raises if the path exists as a file
+        dir_path.mkdir(parents=True, exist_ok=True)
+        created.append(str(dir_path))
+        logging.info(f"Created directory: {directory}")
     
     return created
 
@@ -83,9 +86,10 @@ def check_dependencies() -> Tuple[bool, List[str]]:
     
     missing = []
     for package in required_packages:
+        # Read installed metadata only; avoids executing the package on import
         try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
+            distribution(package)
+        except PackageNotFoundError:
             missing.append(package)
     
     return len(missing) == 0, missing
@@ -94,8 +98,7 @@ def create_env_example():
     """Create .env.example file if it doesn't exist."""
     env_example_path = Path('.env.example')
     
-    if not env_example_path.exists():
-        env_content = """# Morning Digest Environment Variables
+    env_content = """# Morning Digest Environment Variables
 # Copy this file to .env and fill in your actual values
 
 # Claude AI API Key (required)
@@ -112,10 +115,14 @@ MORNING_DIGEST_OPENWEATHER_API_KEY=your_openweather_api_key
 # MORNING_DIGEST_LOG_LEVEL=INFO
 # MORNING_DIGEST_TOKEN_BUDGET=10000
 """
-        env_example_path.write_text(env_content)
-        logging.info("Created .env.example file")
-    else:
+    # Exclusive create: one open() both checks for and creates the file
+    try:
+        with env_example_path.open('x') as f:
+            f.write(env_content)
+    except FileExistsError:
         logging.info(".env.example already exists")
+    else:
+        logging.info("Created .env.example file")
 
 def setup_gitignore():
     """Ensure .gitignore includes necessary entries."""
@@ -129,29 +136,44 @@ def setup_gitignore():
         '__pycache__/',
         '*.pyc',
         '.pytest_cache/',
-        'data/temp/'
+        'data/temp/',
+        'data/llm_cache.sqlite3',
+        'data/gmail_message_cache.sqlite3',
+        'data/news_feed_cache.json',
+        'data/medium_feed_cache.json'
     ]
     
-    existing_content = ""
-    if gitignore_path.exists():
+    try:
         existing_content = gitignore_path.read_text()
+    except FileNotFoundError:
+        existing_content = ""
     
-    new_entries = []
-    for entry in required_entries:
-        if entry not in existing_content:
-            new_entries.append(entry)
+    # Compare whole lines so e.g. a comment mentioning 'logs/' doesn't count
+    existing_lines = {line.strip() for line in existing_content.splitlines()}
+    new_entries = [entry for entry in required_entries if entry not in existing_lines]
     
     if new_entries:
+        lines = []
+        if existing_content and not existing_content.endswith('\n'):
+            lines.append('')
+        lines.append('# Morning Digest')
+        lines.extend(new_entries)
         with gitignore_path.open('a') as f:
-            if existing_content and not existing_content.endswith('\n'):
-                f.write('\n')
-            f.write('# Morning Digest\n')
-            for entry in new_entries:
-                f.write(f"{entry}\n")
+            f.write('\n'.join(lines) + '\n')
         logging.info(f"Added {len(new_entries)} entries to .gitignore")
     else:
         logging.info(".gitignore is up to date")
 
+def precompile_sources() -> bool:
+    """Precompile application sources to bytecode so cold runs skip parsing."""
+    # workers=0 uses one process per CPU core
+    success = compileall.compile_dir('src', quiet=1, workers=0)
+    if success:
+        logging.info("Precompiled application bytecode")
+    else:
+        logging.warning("Some source files failed to compile")
+    return bool(success)
+
 def main():
     """Main setup function."""
     setup_logging()
@@ -196,6 +218,9 @@ def main():
     else:
         logging.info("All required Python packages are installed")
     
+    # Warm the bytecode cache for scheduled runs
+    precompile_sources()
+    
     # Final status
     if env_valid and config_valid and deps_valid:
         logging.info("✅ Setup completed successfully!")
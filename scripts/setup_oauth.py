@@ -1,12 +1,12 @@
-#!/usr/bin/env python3
-"""
-OAuth setup helper for Google Calendar and Gmail APIs
-Run this once to set up authentication
-"""
-
-def main():
-    print("Setting up Google OAuth credentials...")
-    # Interactive OAuth setup logic
-    
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+OAuth setup helper for Google Calendar and Gmail APIs
+Run this once to set up authentication
+"""
+
+def main():
+    print("Setting up Google OAuth credentials...")
+    # Interactive OAuth setup logic
+    
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,13 +1,13 @@
-#!/usr/bin/env python3
-"""
-Test individual agents with sample data
-Useful for development and debugging
-"""
-
-def test_agent(agent_name: str, sample_data_file: str):
-    # Load agent and test with sample data
-    pass
-
-if __name__ == "__main__":
-    # CLI for testing agents individually
+#!/usr/bin/env python3
+"""
+Test individual agents with sample data
+Useful for development and debugging
+"""
+
+def test_agent(agent_name: str, sample_data_file: str):
+    # Load agent and test with sample data
+    pass
+
+if __name__ == "__main__":
+    # CLI for testing agents individually
     pass
\ No newline at end of file
@@ -9,12 +9,18 @@ import sys
 import logging
 import asyncio
 import tempfile
+import functools
+import importlib
+import importlib.util
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Always test this checkout's src, ahead of any installed (possibly stale)
+# copy, even when the project is pip-installed
+SRC_DIR = str(Path(__file__).resolve().parent.parent / "src")
+if sys.path[:1] != [SRC_DIR]:
+    sys.path.insert(0, SRC_DIR)
 
 def setup_logging():
     """Setup logging for test output."""
@@ -23,6 +29,31 @@ def setup_logging():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
+def check_import(module_path: str, class_name: str) -> Optional[str]:
+    """Import module_path and look up class_name; return an error message or None."""
+    try:
+        # find_spec resolves the module without executing it, so missing
+        # modules fail fast
+        if importlib.util.find_spec(module_path) is None:
+            return f"No module named '{module_path}'"
+        module = importlib.import_module(module_path)
+        getattr(module, class_name)
+    except Exception as e:
+        return str(e)
+    return None
+
+@functools.lru_cache(maxsize=None)
+def get_config_loader():
+    """Shared ConfigLoader so the config is parsed once per test run."""
+    from utils.config_loader import ConfigLoader
+    return ConfigLoader()
+
+@functools.lru_cache(maxsize=None)
+def get_token_manager():
+    """Shared TokenManager built on the shared ConfigLoader."""
+    from utils.token_manager import TokenManager
+    return TokenManager(get_config_loader())
+
 class SystemTester:
     """Comprehensive system testing class."""
     
@@ -62,14 +93,14 @@ class SystemTester:
             ('orchestration.agent_coordinator', 'AgentCoordinator'),
         ]
         
+        errors = [check_import(module_path, class_name) for module_path, class_name in modules_to_test]
+        
         failed_imports = []
-        for module_path, class_name in modules_to_test:
-            try:
-                module = __import__(module_path, fromlist=[class_name])
-                getattr(module, class_name)
+        for (module_path, class_name), error in zip(modules_to_test, errors):
+            if error is None:
                 self.logger.info(f"✅ {module_path}.{class_name}")
-            except Exception as e:
-                self.logger.error(f"❌ {module_path}.{class_name}: {e}")
+            else:
+                self.logger.error(f"❌ {module_path}.{class_name}: {error}")
                 failed_imports.append(f"{module_path}.{class_name}")
         
         success = len(failed_imports) == 0
@@ -85,10 +116,8 @@ class SystemTester:
         self.logger.info("Testing configuration loading...")
         
         try:
-            from utils.config_loader import ConfigLoader
-            
             # Test with default config
-            config_loader = ConfigLoader()
+            config_loader = get_config_loader()
             config = config_loader.load_config()
             
             required_sections = ['claude', 'email', 'logging', 'context']
@@ -126,16 +155,14 @@ class SystemTester:
         self.logger.info("Testing agent initialization...")
         
         try:
-            from utils.config_loader import ConfigLoader
-            from utils.token_manager import TokenManager
             from agents.norwegian_news_agent import NorwegianNewsAgent
             from agents.tech_intelligence_agent import TechIntelligenceAgent
             from agents.calendar_intelligence_agent import CalendarIntelligenceAgent
             from agents.newsletter_intelligence_agent import NewsletterIntelligenceAgent
             from agents.master_coordinator_agent import MasterCoordinatorAgent
             
-            config_loader = ConfigLoader()
-            token_manager = TokenManager(config_loader)
+            config_loader = get_config_loader()
+            token_manager = get_token_manager()
             
             # Test agent initialization (without API calls)
             agents = [
@@ -172,13 +199,12 @@ class SystemTester:
         self.logger.info("Testing service initialization...")
         
         try:
-            from utils.config_loader import ConfigLoader
             from services.news_collector import NewsCollector
             from services.calendar_service import CalendarService
             from services.newsletter_processor import NewsletterProcessor
             from services.weather_service import WeatherService
             
-            config_loader = ConfigLoader()
+            config_loader = get_config_loader()
             
             services = [
                 ('NewsCollector', NewsCollector),
@@ -215,9 +241,8 @@ class SystemTester:
         try:
             from formatters.html_formatter import HTMLFormatter
             from formatters.text_formatter import TextFormatter
-            from utils.config_loader import ConfigLoader
             
-            config_loader = ConfigLoader()
+            config_loader = get_config_loader()
             
             # Sample data for testing
             sample_data = {
@@ -282,11 +307,9 @@ class SystemTester:
         try:
             from orchestration.digest_orchestrator import DigestOrchestrator
             from orchestration.agent_coordinator import AgentCoordinator
-            from utils.config_loader import ConfigLoader
-            from utils.token_manager import TokenManager
             
-            config_loader = ConfigLoader()
-            token_manager = TokenManager(config_loader)
+            config_loader = get_config_loader()
+            token_manager = get_token_manager()
             
             # Test AgentCoordinator initialization
             agent_coordinator = AgentCoordinator(config_loader, token_manager)
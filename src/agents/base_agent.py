@@ -1,34 +1,206 @@
-import json
-import asyncio
-from anthropic import Anthropic
-from typing import Dict, Any, Optional
-
-class BaseAgent:
-    def __init__(self, name: str, system_prompt: str, api_key: str):
-        self.name = name
-        self.system_prompt = system_prompt
-        self.client = Anthropic(api_key=api_key)
-        
-    async def process(self, data: Dict[str, Any], context: Optional[Dict] = None) -> Dict[str, Any]:
-        """Process data and return structured results"""
-        try:
-            response = await self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=1000,
-                system=self.system_prompt,
-                messages=[{
-                    "role": "user", 
-                    "content": self._format_input(data, context)
-                }]
-            )
-            return self._parse_response(response.content[0].text)
-        except Exception as e:
-            return {"error": f"{self.name} failed: {str(e)}", "data": data}
-    
-    def _format_input(self, data: Dict, context: Optional[Dict]) -> str:
-        """Override in subclasses for agent-specific formatting"""
-        return json.dumps(data, indent=2)
-    
-    def _parse_response(self, response: str) -> Dict:
-        """Override in subclasses for structured output parsing"""
+import json
+import asyncio
+import functools
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, AsyncIterator, Optional, Union, TYPE_CHECKING
+
+from .llm_cache import LLMCache, MemoryBackend, SQLiteBackend
+
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from importlib.resources import files as resource_files
+except ImportError:
+    # Python 3.8
+    resource_files = None
+
+_DECODER = json.JSONDecoder()
+
+def extract_json(text: str) -> Optional[Dict[str, Any]]:
+    """Return the first complete JSON object embedded in text, or None"""
+    start = text.find('{')
+    while start != -1:
+        try:
+            obj, _ = _DECODER.raw_decode(text, start)
+            return obj
+        except ValueError:
+            start = text.find('{', start + 1)
+    return None
+
+@functools.lru_cache(maxsize=None)
+def get_token_encoder():
+    """cl100k_base encoder as used by TokenCounter, or None without tiktoken"""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+def count_tokens(text: str) -> int:
+    """Approximate token count, estimating 4 characters per token without tiktoken"""
+    encoder = get_token_encoder()
+    if encoder is None:
+        return len(text) // 4
+    return len(encoder.encode(text))
+
+# Shipped as package data, so installed (non-editable) copies find them too
+if resource_files is not None:
+    PROMPTS_DIR = resource_files(__package__) / "prompts"
+else:
+    PROMPTS_DIR = Path(__file__).resolve().parent / "prompts"
+_PROMPT_CACHE: Dict[str, str] = {}
+
+def load_prompt(name: str) -> str:
+    """Read the agents' prompts/<name>.txt, once per process"""
+    prompt = _PROMPT_CACHE.get(name)
+    if prompt is None:
+        prompt = (PROMPTS_DIR / f"{name}.txt").read_text(encoding="utf-8").strip()
+        _PROMPT_CACHE[name] = prompt
+    return prompt
+
+@dataclass(frozen=True)
+class AgentError:
+    """Returned by BaseAgent.process when the agent call fails"""
+    __slots__ = ('agent', 'message')
+    agent: str
+    message: str
+
+@functools.lru_cache(maxsize=None)
+def _get_client(api_key: str) -> "AsyncAnthropic":
+    """Shared client per API key so all agents reuse one connection pool"""
+    # The SDK (and httpx/pydantic under it) is imported on first use only
+    import httpx
+    from anthropic import AsyncAnthropic
+    try:
+        import h2  # noqa: F401 - enables HTTP/2 support in httpx
+        http2 = True
+    except ImportError:
+        http2 = False
+    return AsyncAnthropic(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+        )
+    )
+
+class BaseAgent:
+    MODEL = "claude-3-5-sonnet-20241022"
+    
+    # Start of the assistant turn, e.g. "{" to make the model answer in raw JSON.
+    # It is part of the returned text, so _parse_response sees the whole object
+    RESPONSE_PREFILL = ""
+    
+    # Prompt-response cache shared by all agents (in-process LRU in front of
+    # SQLite), so retries and re-runs on identical input skip the API call
+    CACHE_TTL = 3600
+    llm_cache = LLMCache([MemoryBackend(max_entries=128), SQLiteBackend()])
+    
+    # Anthropic ignores cache_control on prefixes shorter than this
+    MIN_CACHEABLE_TOKENS = 1024
+    
+    # Cap on in-flight API requests across all agents, to stay under rate limits
+    MAX_CONCURRENT_REQUESTS = 4
+    _limiter: Optional[asyncio.Semaphore] = None
+    _limiter_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def __init__(self, name: str, system_prompt: str, api_key: str):
+        self.name = name
+        self.system_prompt = system_prompt
+        self._api_key = api_key
+    
+    @functools.cached_property
+    def client(self) -> "AsyncAnthropic":
+        """Anthropic client, created on first access"""
+        return _get_client(self._api_key)
+    
+    @functools.cached_property
+    def system_prompt_tokens(self) -> int:
+        """Token count of the system prompt, computed once per agent"""
+        return count_tokens(self.system_prompt)
+        
+    async def process(self, data: Dict[str, Any], context: Optional[Dict] = None,
+                      use_cache: bool = True) -> Union[Dict[str, Any], AgentError]:
+        """Process data and return structured results"""
+        try:
+            user_content = self._format_input(data, context)
+            # Health checks must reach the API, not an earlier cached answer
+            if not use_cache:
+                chunks = [text async for text in self._stream_text(user_content)]
+                return self._parse_response("".join(chunks))
+            cache_key = self.llm_cache.cache_key(
+                self.MODEL, self.system_prompt, self._cache_input(data, context, user_content)
+            )
+            response_text = self.llm_cache.get(cache_key)
+            if response_text is None:
+                chunks = [text async for text in self._stream_text(user_content)]
+                response_text = "".join(chunks)
+                self.llm_cache.set(cache_key, response_text, ttl=self.CACHE_TTL)
+            return self._parse_response(response_text)
+        except Exception as e:
+            return AgentError(self.name, f"{self.name} failed: {str(e)}")
+    
+    def _request_params(self, user_content: str, max_tokens: int = 1000, prefill: str = "") -> Dict[str, Any]:
+        """Messages API parameters for a formatted user message"""
+        messages = [{
+            "role": "user", 
+            "content": user_content
+        }]
+        if prefill:
+            messages.append({"role": "assistant", "content": prefill})
+        system_block = {"type": "text", "text": self.system_prompt}
+        # Static per-agent prompt; mark it cacheable so repeat calls skip re-processing
+        if self.system_prompt_tokens >= self.MIN_CACHEABLE_TOKENS:
+            system_block["cache_control"] = {"type": "ephemeral"}
+        return {
+            "model": self.MODEL,
+            "max_tokens": max_tokens,
+            "system": [system_block],
+            "messages": messages
+        }
+    
+    @classmethod
+    def _request_limiter(cls) -> asyncio.Semaphore:
+        """Semaphore shared by every agent, recreated per event loop"""
+        loop = asyncio.get_running_loop()
+        if BaseAgent._limiter_loop is not loop:
+            BaseAgent._limiter = asyncio.Semaphore(cls.MAX_CONCURRENT_REQUESTS)
+            BaseAgent._limiter_loop = loop
+        return BaseAgent._limiter
+    
+    async def _stream_text(self, user_content: str, max_tokens: int = 1000, prefill: Optional[str] = None) -> AsyncIterator[str]:
+        """Stream the model response for a formatted user message"""
+        if prefill is None:
+            prefill = self.RESPONSE_PREFILL
+        if prefill:
+            yield prefill
+        async with self._request_limiter():
+            async with self.client.messages.stream(**self._request_params(user_content, max_tokens, prefill)) as stream:
+                async for text in stream.text_stream:
+                    yield text
+    
+    def _cache_input(self, data: Dict, context: Optional[Dict], user_content: str) -> str:
+        """Text the response cache is keyed on; override to let equivalent inputs share an entry"""
+        return user_content
+    
+    def _format_input(self, data: Dict, context: Optional[Dict]) -> str:
+        """Override in subclasses for agent-specific formatting"""
+        # Compact output; the model doesn't need pretty-printing. Collector
+        # data carries datetimes (e.g. calendar events): orjson writes them as
+        # ISO 8601 natively, the json fallback via str()
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=str)
+    
+    def _parse_response(self, response: str) -> Dict:
+        """Override in subclasses for structured output parsing"""
+        # Results stay plain dicts: formatters and the orchestrator read them
+        # with .get()/'in', and they are serialized into the coordinator input
         return {"analysis": response}
\ No newline at end of file
@@ -1,26 +1,6 @@
-from .base_agent import BaseAgent
-
-class CalendarIntelligenceAgent(BaseAgent):
-    def __init__(self, api_key: str):
-        system_prompt = """
-You are a personal productivity assistant analyzing calendar events.
-
-CONTEXT: User is a parent with boys aged 5 and 8, partner aged 39, transitioning careers to AI/ML.
-
-ANALYZE calendar events for:
-- Priority classification (High/Medium/Low)
-- Preparation requirements
-- Family coordination needs
-- Learning/networking opportunities
-- Potential conflicts or stress points
-- Time optimization suggestions
-
-For each event, determine:
-1. Priority level and reasoning
-2. Preparation needed (if any)
-3. Family impact considerations
-4. Strategic importance for career transition
-
-Return structured analysis highlighting today's priorities and this week's key events.
-        """
+from .base_agent import BaseAgent, load_prompt
+
+class CalendarIntelligenceAgent(BaseAgent):
+    def __init__(self, api_key: str):
+        system_prompt = load_prompt("calendar_intelligence")
         super().__init__("CalendarIntelligence", system_prompt, api_key)
\ No newline at end of file
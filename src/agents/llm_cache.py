@@ -0,0 +1,125 @@
+import json
+import time
+import hashlib
+import logging
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Protocol, Tuple
+
+# Lifetime of entries copied from a slower backend into a faster one
+PROMOTION_TTL = 300
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> Optional[str]:
+        ...
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        ...
+
+class MemoryBackend:
+    """Bounded in-process LRU with per-entry expiry"""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at < time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        self._entries[key] = (value, time.time() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+class SQLiteBackend:
+    """Persistent cache so responses survive between digest runs"""
+
+    def __init__(self, path: str = "data/llm_cache.sqlite3"):
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at INTEGER NOT NULL)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at < time.time():
+            with conn:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            return None
+        return value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, int(time.time()) + ttl)
+            )
+
+class LLMCache:
+    """Prompt-response cache checked in order across backends (fastest first)"""
+
+    def __init__(self, backends: List[CacheBackend]):
+        self.backends = backends
+        self.logger = logging.getLogger('llm_cache')
+        self.hits = 0
+        self.misses = 0
+        self.tokens_saved = 0
+
+    @staticmethod
+    def cache_key(model: str, system_prompt: str, formatted_input: str) -> str:
+        """Deterministic key over everything that determines the response"""
+        payload = json.dumps(
+            {'model': model, 'system': system_prompt, 'input': formatted_input},
+            sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        for index, backend in enumerate(self.backends):
+            try:
+                value = backend.get(key)
+            except Exception as e:
+                self.logger.warning(f"Cache backend {type(backend).__name__} get failed: {e}")
+                continue
+            if value is not None:
+                # Promote to the faster backends in front of this one
+                for faster in self.backends[:index]:
+                    faster.set(key, value, ttl=PROMOTION_TTL)
+                self.hits += 1
+                self.tokens_saved += len(value) // 4  # rough chars-per-token estimate
+                self.logger.info(f"LLM cache hit ({self.hits} hits, ~{self.tokens_saved} tokens saved)")
+                return value
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        for backend in self.backends:
+            try:
+                backend.set(key, value, ttl)
+            except Exception as e:
+                self.logger.warning(f"Cache backend {type(backend).__name__} set failed: {e}")
@@ -1,24 +1,6 @@
-from .base_agent import BaseAgent
-
-class MasterCoordinatorAgent(BaseAgent):
-    def __init__(self, api_key: str):
-        system_prompt = """
-You are the master coordinator creating a personalized morning digest.
-
-TASK: Synthesize insights from specialized agents into a cohesive, actionable morning briefing.
-
-STRUCTURE the digest as:
-1. **Priority Today**: Most important items requiring attention
-2. **News Highlights**: Key developments with personal relevance
-3. **Tech Intelligence**: Career-relevant insights and opportunities
-4. **Calendar Focus**: Today's priorities and this week's key events
-5. **Learning Opportunities**: From newsletters and tech content
-6. **Weather & Practical**: Weather-based recommendations
-
-TONE: Concise, actionable, personally relevant
-LENGTH: Aim for 4-5 minute read maximum
-FOCUS: Help prioritize day and identify opportunities
-
-Consider the user's context as a newly educated ML engineer, and interested in AI, parent in Trondheim.
-        """
+from .base_agent import BaseAgent, load_prompt
+
+class MasterCoordinatorAgent(BaseAgent):
+    def __init__(self, api_key: str):
+        system_prompt = load_prompt("master_coordinator")
         super().__init__("MasterCoordinator", system_prompt, api_key)
\ No newline at end of file
@@ -1,33 +1,6 @@
-from .base_agent import BaseAgent
-
-class TechIntelligenceAgent(BaseAgent):
-    def __init__(self, api_key: str):
-        system_prompt = """
-You are a tech industry analyst specializing in AI/ML career transitions.
-
-EXPERTISE AREAS:
-- AI/ML job market trends
-- Python development opportunities
-- No-code/low-code developments affecting traditional coding
-- Skills gap analysis for career changers
-- Learning resource identification
-- Industry hiring patterns
-
-TASK: Analyze tech content for someone transitioning from restaurant management to AI/ML.
-
-Focus on:
-- Career-relevant skill developments
-- Job market insights
-- Learning opportunities
-- Industry trends affecting career prospects
-- Tools and technologies worth learning
-
-For each relevant item, provide:
-1. Career relevance score (1-10)
-2. Key insight summary
-3. Actionable next steps
-4. Learning resources if applicable
-
-Return as JSON, sorted by career relevance.
-        """
+from .base_agent import BaseAgent, load_prompt
+
+class TechIntelligenceAgent(BaseAgent):
+    def __init__(self, api_key: str):
+        system_prompt = load_prompt("tech_intelligence")
         super().__init__("TechIntelligence", system_prompt, api_key)
\ No newline at end of file
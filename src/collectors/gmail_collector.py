@@ -1,179 +1,497 @@
-import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-import json
-import logging
-import re
-import base64
-from email.mime.text import MIMEText
-
-from google.oauth2.credentials import Credentials
-from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow import Flow
-from googleapiclient.discovery import build
-import os
-
-class GmailCollector:
-    def __init__(self, credentials_path: str, token_path: str = "gmail_token.json"):
-        self.credentials_path = credentials_path
-        self.token_path = token_path
-        self.service = None
-        self.scopes = [
-            'https://www.googleapis.com/auth/gmail.readonly',
-            'https://www.googleapis.com/auth/gmail.send'
-        ]
-    
-    def authenticate(self):
-        """Handle Gmail API authentication"""
-        creds = None
-        
-        # Load existing token
-        if os.path.exists(self.token_path):
-            creds = Credentials.from_authorized_user_file(self.token_path, self.scopes)
-        
-        # Refresh or get new credentials
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                flow = Flow.from_client_secrets_file(self.credentials_path, self.scopes)
-                flow.redirect_uri = 'urn:ietf:wg:oauth:2.0:oob'
-                
-                auth_url, _ = flow.authorization_url(prompt='consent')
-                print(f'Please visit this URL to authorize Gmail access: {auth_url}')
-                
-                auth_code = input('Enter the authorization code: ')
-                flow.fetch_token(code=auth_code)
-                creds = flow.credentials
-            
-            # Save credentials
-            with open(self.token_path, 'w') as token:
-                token.write(creds.to_json())
-        
-        self.service = build('gmail', 'v1', credentials=creds)
-    
-    async def collect_newsletters(self, hours_back: int = 24) -> Dict[str, Any]:
-        """Collect newsletters from the last 24 hours"""
-        if not self.service:
-            self.authenticate()
-        
-        try:
-            # Calculate time range
-            since_time = datetime.now() - timedelta(hours=hours_back)
-            since_timestamp = int(since_time.timestamp())
-            
-            # Enhanced newsletter detection query
-            queries = [
-                f'after:{since_timestamp} (unsubscribe OR newsletter OR digest OR "weekly update" OR "daily briefing")',
-                f'after:{since_timestamp} from:(substack.com OR medium.com OR mailchimp OR constantcontact)',
-                f'after:{since_timestamp} subject:(newsletter OR digest OR roundup OR briefing OR update OR highlights)'
-            ]
-            
-            all_newsletters = []
-            seen_message_ids = set()
-            
-            for query in queries:
-                messages = await self._get_messages(query)
-                for message in messages:
-                    if message['id'] not in seen_message_ids:
-                        newsletter_data = await self._extract_newsletter_content(message)
-                        if newsletter_data:
-                            all_newsletters.append(newsletter_data)
-                            seen_message_ids.add(message['id'])
-            
-            # Sort by newsletter score and recency
-            all_newsletters.sort(key=lambda x: (x.get('newsletter_score', 0), x.get('timestamp', 0)), reverse=True)
-            
-            return {
-                'newsletters': all_newsletters,
-                'count': len(all_newsletters),
-                'collection_time': datetime.now().isoformat(),
-                'categories': self._categorize_newsletters(all_newsletters)
-            }
-            
-        except Exception as e:
-            logging.error(f"Gmail newsletter collection failed: {e}")
-            return {'error': f'Failed to collect newsletters: {str(e)}'}
-    
-    async def _get_messages(self, query: str) -> List[Dict]:
-        """Get messages matching the query"""
-        try:
-            result = self.service.users().messages().list(userId='me', q=query, maxResults=50).execute()
-            messages = result.get('messages', [])
-            
-            # Get next page if available (up to 100 total messages)
-            if 'nextPageToken' in result and len(messages) < 100:
-                next_result = self.service.users().messages().list(
-                    userId='me', 
-                    q=query, 
-                    pageToken=result['nextPageToken'],
-                    maxResults=50
-                ).execute()
-                messages.extend(next_result.get('messages', []))
-            
-            return messages
-            
-        except Exception as e:
-            logging.error(f"Error getting messages: {e}")
-            return []
-    
-    async def _extract_newsletter_content(self, message: Dict) -> Optional[Dict]:
-        """Extract content from potential newsletter message"""
-        try:
-            msg_id = message['id']
-            msg_detail = self.service.users().messages().get(
-                userId='me', 
-                id=msg_id,
-                format='full'
-            ).execute()
-            
-            # Extract headers
-            headers = {h['name']: h['value'] for h in msg_detail['payload']['headers']}
-            
-            sender = headers.get('From', '')
-            subject = headers.get('Subject', '')
-            date_header = headers.get('Date', '')
-            
-            # Extract content
-            content = self._extract_message_content(msg_detail['payload'])
-            
-            # Calculate newsletter likelihood
-            newsletter_score = self._calculate_newsletter_score(sender, subject, content)
-            
-            if newsletter_score > 0.4:  # Lower threshold to capture more newsletters
-                return {
-                    'sender': self._clean_sender(sender),
-                    'sender_email': self._extract_email(sender),
-                    'subject': subject,
-                    'date': date_header,
-                    'timestamp': self._parse_email_date(date_header),
-                    'content': self._clean_content(content),
-                    'snippet': msg_detail.get('snippet', ''),
-                    'newsletter_score': newsletter_score,
-                    'message_id': msg_id,
-                    'category': self._categorize_newsletter(sender, subject, content),
-                    'key_topics': self._extract_key_topics(content),
-                    'has_offers': self._detect_offers(content),
-                    'has_events': self._detect_events(content)
-                }
-            
-            return None
-            
-        except Exception as e:
-            logging.error(f"Error extracting newsletter content: {e}")
-            return None
-    
-    def _extract_message_content(self, payload: Dict) -> str:
-        """Extract text content from email payload"""
-        content = ""
-        
-        if 'parts' in payload:
-            for part in payload['parts']:
-                if part['mimeType'] == 'text/plain':
-                    data = part['body'].get('data', '')
-                    if data:
-                        content += base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
-                elif part['mimeType'] == 'text/html':
-                    data = part['body'].get('data', '')
-                    if data:
-                        html_content = base64.urlsafe_b
\ No newline at end of file
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional
+import json
+import logging
+import re
+import base64
+import email
+import html
+from email import policy
+from email.header import decode_header, make_header
+from email.message import EmailMessage
+from email.mime.text import MIMEText
+from email.utils import parsedate_to_datetime
+
+from google.oauth2.credentials import Credentials
+from google.auth.transport.requests import Request
+from google_auth_oauthlib.flow import Flow
+from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from ..utils.keyword_matcher import keyword_pattern
+
+# Gmail accepts up to 100 calls per batch but rate-limits batches above 50
+MAX_BATCH_SIZE = 50
+
+# Newsletter signals, one pattern per field, so each text is scanned once without lowercasing a copy
+_SENDER_INDICATORS = keyword_pattern(['newsletter', 'digest', 'news@', 'noreply', 'no-reply', 'substack', 'medium', 'mailchimp', 'updates@'], ignore_case=True)
+_SUBJECT_INDICATORS = keyword_pattern(['newsletter', 'digest', 'weekly', 'daily', 'roundup', 'briefing', 'highlights', 'update', 'issue #'], ignore_case=True)
+_UNSUBSCRIBE_INDICATORS = keyword_pattern(['unsubscribe', 'avmeld'], ignore_case=True)
+_BROWSER_VIEW_INDICATORS = keyword_pattern(['view in browser', 'view this email'], ignore_case=True)
+
+# How long processed-message results are kept between runs
+MESSAGE_CACHE_DAYS = 7
+
+# Messages scoring above this are kept (low, to capture more newsletters)
+NEWSLETTER_THRESHOLD = 0.4
+
+# Headers that mark list/bulk mail; any of them makes a message a newsletter
+BULK_MAIL_HEADERS = ['List-Unsubscribe', 'List-Id', 'Precedence', 'Feedback-ID']
+BULK_MAIL_SCORE = 0.9
+
+# Body signals added to the sender/subject score in _calculate_newsletter_score
+UNSUBSCRIBE_SCORE = 0.3
+BROWSER_VIEW_SCORE = 0.1
+
+# Most the body can add; _may_be_newsletter relies on this bound to skip full fetches
+MAX_CONTENT_SCORE = UNSUBSCRIBE_SCORE + BROWSER_VIEW_SCORE
+
+def _decode_header(value: str) -> str:
+    """Decode RFC 2047 encoded words, as the full-message parser does"""
+    try:
+        return str(make_header(decode_header(value)))
+    except (LookupError, ValueError):
+        return value
+
+_RE_SCRIPT_STYLE = re.compile(r'<(script|style)[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE)
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+_RE_ANGLE_ADDRESS = re.compile(r'<([^>]+)>')
+_RE_URL = re.compile(r'https?://\S+')
+
+# Interest topics reported per newsletter, in reporting order
+KEY_TOPICS = (
+    'ai', 'machine learning', 'python', 'automation', 'productivity',
+    'data science', 'career', 'parenting', 'startup', 'no-code'
+)
+_RE_KEY_TOPIC = re.compile(r'\b(' + '|'.join(re.escape(topic) for topic in KEY_TOPICS) + r')\b', re.IGNORECASE)
+
+class GmailCollector:
+    def __init__(self, credentials_path: str, token_path: str = "gmail_token.json",
+                 cache_path: str = "data/gmail_message_cache.sqlite3"):
+        self.credentials_path = credentials_path
+        self.token_path = token_path
+        self.cache_path = Path(cache_path)
+        self._cache_conn: Optional[sqlite3.Connection] = None
+        self.service = None
+        self.credentials = None
+        self._thread_http = threading.local()
+        self.scopes = [
+            'https://www.googleapis.com/auth/gmail.readonly',
+            'https://www.googleapis.com/auth/gmail.send'
+        ]
+    
+    def authenticate(self):
+        """Handle Gmail API authentication"""
+        creds = None
+        
+        # Load existing token
+        if os.path.exists(self.token_path):
+            creds = Credentials.from_authorized_user_file(self.token_path, self.scopes)
+        
+        # Refresh or get new credentials
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                flow = Flow.from_client_secrets_file(self.credentials_path, self.scopes)
+                flow.redirect_uri = 'urn:ietf:wg:oauth:2.0:oob'
+                
+                auth_url, _ = flow.authorization_url(prompt='consent')
+                print(f'Please visit this URL to authorize Gmail access: {auth_url}')
+                
+                auth_code = input('Enter the authorization code: ')
+                flow.fetch_token(code=auth_code)
+                creds = flow.credentials
+            
+            # Save credentials
+            with open(self.token_path, 'w') as token:
+                token.write(creds.to_json())
+        
+        self.credentials = creds
+        self.service = build('gmail', 'v1', credentials=creds, cache_discovery=False)
+    
+    async def collect_newsletters(self, hours_back: int = 24) -> Dict[str, Any]:
+        """Collect newsletters from the last 24 hours"""
+        if not self.service:
+            # Token refresh (or the interactive flow) blocks on network/stdin
+            await asyncio.get_running_loop().run_in_executor(None, self.authenticate)
+        
+        try:
+            # Calculate time range
+            since_time = datetime.now() - timedelta(hours=hours_back)
+            since_timestamp = int(since_time.timestamp())
+            
+            # Enhanced newsletter detection query
+            queries = [
+                f'after:{since_timestamp} (unsubscribe OR newsletter OR digest OR "weekly update" OR "daily briefing")',
+                f'after:{since_timestamp} from:(substack.com OR medium.com OR mailchimp OR constantcontact)',
+                f'after:{since_timestamp} subject:(newsletter OR digest OR roundup OR briefing OR update OR highlights)'
+            ]
+            
+            # The queries overlap heavily; fetch each matching message once
+            message_ids = await self._get_messages(queries)
+            
+            # Messages are immutable, so earlier runs' outcomes (newsletter data,
+            # or None for rejected) still hold; only new ids are fetched
+            cached_results = self._load_cached_results(message_ids)
+            new_ids = [msg_id for msg_id in message_ids if msg_id not in cached_results]
+            new_results: Dict[str, Optional[Dict]] = {}
+            
+            # Headers first: messages that can't reach the threshold whatever
+            # their body says are never downloaded in full
+            message_headers = await self._get_message_details(
+                new_ids, message_format='metadata', metadata_headers=['From', 'Subject', *BULK_MAIL_HEADERS]
+            )
+            candidate_ids = []
+            for msg_id in new_ids:
+                if self._may_be_newsletter(message_headers.get(msg_id)):
+                    candidate_ids.append(msg_id)
+                else:
+                    new_results[msg_id] = None
+            
+            message_details = await self._get_message_details(candidate_ids)
+            for msg_id, msg_detail in message_details.items():
+                try:
+                    new_results[msg_id] = self._extract_newsletter_content(msg_detail)
+                except Exception as e:
+                    # Left out of the cache, so a transient failure is retried next
+                    # run instead of hiding the message for MESSAGE_CACHE_DAYS
+                    logging.error(f"Error extracting newsletter content from {msg_id}: {e}")
+            self._store_cached_results(new_results)
+            
+            results = {**cached_results, **new_results}
+            all_newsletters = [results[msg_id] for msg_id in message_ids if results.get(msg_id)]
+            
+            # Sort by newsletter score and recency
+            all_newsletters.sort(key=lambda x: (x.get('newsletter_score', 0), x.get('timestamp', 0)), reverse=True)
+            
+            return {
+                'newsletters': all_newsletters,
+                'count': len(all_newsletters),
+                'collection_time': datetime.now().isoformat(),
+                'categories': self._categorize_newsletters(all_newsletters)
+            }
+            
+        except Exception as e:
+            logging.error(f"Gmail newsletter collection failed: {e}")
+            return {'error': f'Failed to collect newsletters: {str(e)}'}
+    
+    def _cache_connect(self) -> sqlite3.Connection:
+        if self._cache_conn is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._cache_conn = sqlite3.connect(str(self.cache_path))
+            self._cache_conn.execute(
+                "CREATE TABLE IF NOT EXISTS messages "
+                "(id TEXT PRIMARY KEY, result TEXT, stored_at INTEGER NOT NULL)"
+            )
+        return self._cache_conn
+    
+    def _load_cached_results(self, message_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """Results of earlier runs for these message ids (None for rejected messages)"""
+        if not message_ids:
+            return {}
+        try:
+            conn = self._cache_connect()
+            placeholders = ','.join('?' * len(message_ids))
+            rows = conn.execute(
+                f"SELECT id, result FROM messages WHERE id IN ({placeholders})", message_ids
+            ).fetchall()
+        except Exception as e:
+            logging.warning(f"Gmail message cache read failed: {e}")
+            return {}
+        return {msg_id: json.loads(result) if result is not None else None for msg_id, result in rows}
+    
+    def _store_cached_results(self, results: Dict[str, Optional[Dict]]) -> None:
+        """Remember results for later runs, dropping entries past MESSAGE_CACHE_DAYS"""
+        now = int(time.time())
+        try:
+            conn = self._cache_connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO messages (id, result, stored_at) VALUES (?, ?, ?)",
+                    [
+                        (msg_id, json.dumps(result, ensure_ascii=False) if result is not None else None, now)
+                        for msg_id, result in results.items()
+                    ]
+                )
+                # Older messages fall outside any collection window
+                conn.execute("DELETE FROM messages WHERE stored_at < ?", (now - MESSAGE_CACHE_DAYS * 86400,))
+        except Exception as e:
+            logging.warning(f"Gmail message cache write failed: {e}")
+    
+    async def _get_messages(self, queries: List[str]) -> List[str]:
+        """Get ids of messages matching any of the queries, listing all queries in one batch"""
+        messages: Dict[int, List[Dict]] = {index: [] for index in range(len(queries))}
+        page_tokens: Dict[int, str] = {}
+        
+        def handle_response(request_id: str, response: Dict, exception: Optional[Exception]):
+            index = int(request_id)
+            if exception is not None:
+                logging.error(f"Error getting messages: {exception}")
+                return
+            messages[index].extend(response.get('messages', []))
+            if 'nextPageToken' in response:
+                page_tokens[index] = response['nextPageToken']
+        
+        try:
+            batch = self.service.new_batch_http_request(callback=handle_response)
+            for index, query in enumerate(queries):
+                batch.add(
+                    self.service.users().messages().list(userId='me', q=query, maxResults=50),
+                    request_id=str(index)
+                )
+            await self._execute(batch)
+            
+            # Get next page if available (up to 100 total messages per query)
+            next_pages = {index: token for index, token in page_tokens.items() if len(messages[index]) < 100}
+            if next_pages:
+                page_tokens.clear()
+                batch = self.service.new_batch_http_request(callback=handle_response)
+                for index, token in next_pages.items():
+                    batch.add(
+                        self.service.users().messages().list(
+                            userId='me', 
+                            q=queries[index], 
+                            pageToken=token,
+                            maxResults=50
+                        ),
+                        request_id=str(index)
+                    )
+                await self._execute(batch)
+            
+        except Exception as e:
+            logging.error(f"Error getting messages: {e}")
+        
+        # Query order, first match wins
+        return list(dict.fromkeys(
+            message['id'] for index in range(len(queries)) for message in messages[index]
+        ))
+    
+    async def _get_message_details(self, message_ids: List[str], message_format: str = 'raw',
+                                   metadata_headers: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Fetch messages, up to MAX_BATCH_SIZE per HTTP round-trip, batches in parallel"""
+        message_details: Dict[str, Dict] = {}
+        
+        def handle_response(request_id: str, response: Dict, exception: Optional[Exception]):
+            if exception is not None:
+                logging.error(f"Error fetching message {request_id}: {exception}")
+                return
+            message_details[request_id] = response
+        
+        async def fetch(chunk: List[str]):
+            batch = self.service.new_batch_http_request(callback=handle_response)
+            for msg_id in chunk:
+                batch.add(
+                    self.service.users().messages().get(
+                        userId='me', id=msg_id, format=message_format, metadataHeaders=metadata_headers
+                    ),
+                    request_id=msg_id
+                )
+            try:
+                await self._execute(batch)
+            except Exception as e:
+                logging.error(f"Error fetching messages: {e}")
+        
+        await asyncio.gather(*(
+            fetch(message_ids[i:i + MAX_BATCH_SIZE])
+            for i in range(0, len(message_ids), MAX_BATCH_SIZE)
+        ))
+        return message_details
+    
+    async def _execute(self, request) -> Dict:
+        """Run a blocking API (or batch) request in a worker thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: request.execute(http=self._authorized_http()))
+    
+    def _authorized_http(self) -> AuthorizedHttp:
+        """Keep-alive HTTP client for the calling thread, reused across requests"""
+        # httplib2 connections aren't thread-safe, so each worker thread keeps its own
+        local = self._thread_http
+        if getattr(local, 'credentials', None) is not self.credentials:
+            local.http = AuthorizedHttp(self.credentials, http=httplib2.Http(timeout=30))
+            local.credentials = self.credentials
+        return local.http
+    
+    def _extract_newsletter_content(self, msg_detail: Dict) -> Optional[Dict]:
+        """Extract content from potential newsletter message; None if it isn't one, raises if unreadable"""
+        msg_id = msg_detail['id']
+        
+        # The stdlib parser decodes MIME parts and encoded-word headers
+        message = email.message_from_bytes(base64.urlsafe_b64decode(msg_detail['raw']), policy=policy.default)
+        
+        # Extract headers
+        sender = str(message.get('From', ''))
+        subject = str(message.get('Subject', ''))
+        date_header = str(message.get('Date', ''))
+        
+        # Extract content
+        content = self._extract_message_content(message)
+        
+        # Calculate newsletter likelihood; mailing-list headers settle it without scanning the body
+        if self._is_bulk_mail(message):
+            newsletter_score = BULK_MAIL_SCORE
+        else:
+            newsletter_score = self._calculate_newsletter_score(sender, subject, content)
+        
+        if newsletter_score > NEWSLETTER_THRESHOLD:
+            return {
+                'sender': self._clean_sender(sender),
+                'sender_email': self._extract_email(sender),
+                'subject': subject,
+                'date': date_header,
+                'timestamp': self._parse_email_date(date_header),
+                'content': self._clean_content(content),
+                'snippet': msg_detail.get('snippet', ''),
+                'newsletter_score': newsletter_score,
+                'message_id': msg_id,
+                'category': self._categorize_newsletter(sender, subject, content),
+                'key_topics': self._extract_key_topics(content),
+                'has_offers': self._detect_offers(content),
+                'has_events': self._detect_events(content)
+            }
+        
+        return None
+    
+    def _extract_message_content(self, message: EmailMessage) -> str:
+        """Extract text content from a parsed email, preferring the plain-text body"""
+        # Only the chosen body part is decoded; attachments and the
+        # alternative HTML version are skipped
+        body = message.get_body(preferencelist=('plain', 'html'))
+        if body is None:
+            return ""
+        
+        try:
+            content = body.get_content()
+        except (LookupError, ValueError):
+            # Unknown or wrong charset declaration
+            content = body.get_payload(decode=True).decode('utf-8', errors='ignore')
+        
+        if body.get_content_type() == 'text/html':
+            content = self._html_to_text(content)
+        return content
+    
+    def _html_to_text(self, html_content: str) -> str:
+        """Strip scripts, styles and tags from an HTML body"""
+        text = _RE_SCRIPT_STYLE.sub(' ', html_content)
+        text = _RE_HTML_TAG.sub(' ', text)
+        return html.unescape(text)
+    
+    def _may_be_newsletter(self, metadata: Optional[Dict]) -> bool:
+        """Whether a message's From/Subject leave it a chance to pass NEWSLETTER_THRESHOLD"""
+        if metadata is None:
+            # Metadata fetch failed; let the full fetch decide
+            return True
+        # Header names are case-insensitive (senders write both List-Id and List-ID)
+        headers = {h['name'].lower(): h['value'] for h in metadata.get('payload', {}).get('headers', [])}
+        if self._is_bulk_mail(headers):
+            return True
+        score = self._header_score(_decode_header(headers.get('from', '')), _decode_header(headers.get('subject', '')))
+        return score + MAX_CONTENT_SCORE > NEWSLETTER_THRESHOLD
+    
+    def _is_bulk_mail(self, headers) -> bool:
+        """Mailing-list / bulk-sender headers (RFC 2369, RFC 2919, Precedence, Feedback-ID)"""
+        # Lowercase names: works for an EmailMessage and a lowercased metadata dict
+        if any(headers.get(name) for name in ('list-unsubscribe', 'list-id', 'feedback-id')):
+            return True
+        return str(headers.get('precedence', '')).strip().lower() in ('bulk', 'list')
+    
+    def _header_score(self, sender: str, subject: str) -> float:
+        """Newsletter score contributed by the sender and subject"""
+        score = 0.0
+        
+        # Known newsletter platforms and sender patterns
+        if _SENDER_INDICATORS.search(sender):
+            score += 0.4
+        
+        # Subject wording
+        if _SUBJECT_INDICATORS.search(subject):
+            score += 0.3
+        
+        return score
+    
+    def _calculate_newsletter_score(self, sender: str, subject: str, content: str) -> float:
+        """Estimate how likely a message is a newsletter (0.0 - 1.0)"""
+        score = self._header_score(sender, subject)
+        
+        # Bulk-mail footer (at most MAX_CONTENT_SCORE)
+        if _UNSUBSCRIBE_INDICATORS.search(content):
+            score += UNSUBSCRIBE_SCORE
+        if _BROWSER_VIEW_INDICATORS.search(content):
+            score += BROWSER_VIEW_SCORE
+        
+        return min(score, 1.0)
+    
+    def _clean_sender(self, sender: str) -> str:
+        """Display name from a From header, falling back to the address"""
+        name = sender.split('<')[0].strip().strip('"')
+        return name if name else self._extract_email(sender)
+    
+    def _extract_email(self, sender: str) -> str:
+        """Email address from a From header"""
+        match = _RE_ANGLE_ADDRESS.search(sender)
+        if match:
+            return match.group(1).strip().lower()
+        return sender.strip().lower() if '@' in sender else ''
+    
+    def _parse_email_date(self, date_header: str) -> float:
+        """Unix timestamp of an RFC 2822 Date header, 0 if unparseable"""
+        try:
+            return parsedate_to_datetime(date_header).timestamp()
+        except (TypeError, ValueError):
+            return 0
+    
+    def _clean_content(self, content: str) -> str:
+        """Drop links and extra whitespace, and cap the length"""
+        clean = _RE_URL.sub('', content)
+        clean = ' '.join(clean.split())
+        return clean[:3000] + '...' if len(clean) > 3000 else clean
+    
+    def _categorize_newsletter(self, sender: str, subject: str, content: str) -> str:
+        """Categorize newsletter"""
+        text = f"{sender} {subject} {content[:2000]}".lower()
+        
+        if any(term in text for term in ['artificial intelligence', 'machine learning', ' ai ', 'llm', 'gpt']):
+            return 'ai_ml'
+        elif any(term in text for term in ['python', 'programming', 'developer', 'software', 'code']):
+            return 'tech'
+        elif any(term in text for term in ['startup', 'business', 'market', 'finance', 'investing']):
+            return 'business'
+        elif any(term in text for term in ['course', 'learning', 'tutorial', 'education']):
+            return 'learning'
+        elif any(term in text for term in ['news', 'nyheter', 'briefing', 'headlines']):
+            return 'news'
+        elif any(term in text for term in ['sale', 'discount', 'tilbud', 'order', 'shop']):
+            return 'shopping'
+        
+        return 'general'
+    
+    def _extract_key_topics(self, content: str) -> List[str]:
+        """Interest topics mentioned in the content"""
+        # One scan for all topics instead of a search per topic
+        found = {match.group(1).lower() for match in _RE_KEY_TOPIC.finditer(content)}
+        return [topic for topic in KEY_TOPICS if topic in found][:5]
+    
+    def _detect_offers(self, content: str) -> bool:
+        """Check for discounts and promotions"""
+        content_lower = content.lower()
+        return any(term in content_lower for term in ['% off', 'discount', 'promo code', 'coupon', 'tilbud', 'rabatt'])
+    
+    def _detect_events(self, content: str) -> bool:
+        """Check for webinars, conferences and other events"""
+        content_lower = content.lower()
+        return any(term in content_lower for term in ['webinar', 'conference', 'meetup', 'register now', 'rsvp', 'arrangement'])
+    
+    def _categorize_newsletters(self, newsletters: List[Dict]) -> Dict[str, int]:
+        """Count newsletters by category"""
+        categories = {}
+        for newsletter in newsletters:
+            category = newsletter.get('category', 'general')
+            categories[category] = categories.get(category, 0) + 1
+        return categories
\ No newline at end of file
@@ -1,359 +1,491 @@
-import asyncio
-import aiohttp
-import feedparser
-import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-import logging
-import re
-
-class MediumCollector:
-    def __init__(self):
-        self.base_url = "https://medium.com/feed"
-        self.session = None
-        
-        # Your specific interests for filtering
-        self.interest_topics = [
-            'machine-learning', 'artificial-intelligence', 'python', 
-            'data-science', 'programming', 'software-development',
-            'no-code', 'low-code', 'automation', 'productivity',
-            'parenting', 'learning', 'career-change', 'restaurant-management'
-        ]
-        
-        # Popular AI/ML publications on Medium
-        self.publications = [
-            'towards-data-science',
-            'towardsmachinelearning', 
-            'the-artificial-intelligence-publication',
-            'analytics-vidhya',
-            'better-programming',
-            'python-in-plain-english',
-            'the-startup',
-            'hackernoon',
-            'freecodecamp'
-        ]
-    
-    async def collect_medium_content(self, hours_back: int = 24) -> Dict[str, Any]:
-        """Collect Medium articles from various sources"""
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={'User-Agent': 'MorningDigest/1.0 (Personal Content Aggregator)'}
-        ) as session:
-            self.session = session
-            
-            cutoff_time = datetime.now() - timedelta(hours=hours_back)
-            all_articles = []
-            
-            # Collect from different sources in parallel
-            tasks = []
-            
-            # Topic-based feeds
-            for topic in self.interest_topics:
-                tasks.append(self._fetch_topic_feed(topic, cutoff_time))
-            
-            # Publication feeds
-            for pub in self.publications:
-                tasks.append(self._fetch_publication_feed(pub, cutoff_time))
-            
-            # Execute all tasks
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logging.error(f"Failed to fetch Medium content: {result}")
-                    continue
-                
-                if result:
-                    all_articles.extend(result)
-            
-            # Remove duplicates based on URL
-            seen_urls = set()
-            unique_articles = []
-            for article in all_articles:
-                if article['url'] not in seen_urls:
-                    unique_articles.append(article)
-                    seen_urls.add(article['url'])
-            
-            # Sort by relevance and recency
-            unique_articles.sort(key=lambda x: (
-                x.get('relevance_score', 0),
-                x.get('published_timestamp', 0)
-            ), reverse=True)
-            
-            return {
-                'articles': unique_articles[:50],  # Limit to top 50
-                'total_found': len(unique_articles),
-                'collection_time': datetime.now().isoformat(),
-                'categories': self._categorize_articles(unique_articles),
-                'top_publications': self._get_top_publications(unique_articles)
-            }
-    
-    async def _fetch_topic_feed(self, topic: str, cutoff_time: datetime) -> List[Dict]:
-        """Fetch articles from Medium topic feed"""
-        url = f"{self.base_url}/tag/{topic}"
-        return await self._fetch_feed(url, cutoff_time, f"topic:{topic}")
-    
-    async def _fetch_publication_feed(self, publication: str, cutoff_time: datetime) -> List[Dict]:
-        """Fetch articles from Medium publication feed"""
-        url = f"{self.base_url}/@{publication}"
-        return await self._fetch_feed(url, cutoff_time, f"publication:{publication}")
-    
-    async def _fetch_feed(self, url: str, cutoff_time: datetime, source: str) -> List[Dict]:
-        """Generic RSS feed fetcher for Medium"""
-        try:
-            async with self.session.get(url) as response:
-                if response.status != 200:
-                    logging.warning(f"HTTP {response.status} for {url}")
-                    return []
-                
-                content = await response.text()
-                feed = feedparser.parse(content)
-                
-                articles = []
-                
-                for entry in feed.entries:
-                    # Parse publication date
-                    published = self._parse_date(entry.get('published', ''))
-                    if published and published < cutoff_time:
-                        continue
-                    
-                    # Extract and clean content
-                    description = self._clean_description(entry.get('description', ''))
-                    
-                    # Calculate relevance score
-                    relevance = self._calculate_relevance(
-                        entry.get('title', ''),
-                        description,
-                        entry.get('tags', [])
-                    )
-                    
-                    if relevance > 0.3:  # Only include relevant articles
-                        article = {
-                            'title': entry.get('title', 'No title'),
-                            'description': description,
-                            'url': entry.get('link', ''),
-                            'author': self._extract_author(entry),
-                            'published': entry.get('published', ''),
-                            'published_timestamp': published.timestamp() if published else 0,
-                            'tags': self._extract_tags(entry),
-                            'source': source,
-                            'relevance_score': relevance,
-                            'reading_time': self._estimate_reading_time(description),
-                            'category': self._categorize_article(entry.get('title', ''), description),
-                            'is_member_only': self._is_member_only(entry)
-                        }
-                        articles.append(article)
-                
-                logging.info(f"Collected {len(articles)} relevant articles from {source}")
-                return articles
-                
-        except Exception as e:
-            logging.error(f"Error fetching Medium feed {url}: {e}")
-            return []
-    
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """Parse Medium's date format"""
-        if not date_str:
-            return None
-        
-        formats = [
-            '%a, %d %b %Y %H:%M:%S %Z',
-            '%Y-%m-%dT%H:%M:%S.%fZ',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%a, %d %b %Y %H:%M:%S %z'
-        ]
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        
-        logging.warning(f"Could not parse Medium date: {date_str}")
-        return datetime.now()
-    
-    def _clean_description(self, description: str) -> str:
-        """Clean Medium article description"""
-        # Remove HTML tags
-        clean = re.sub(r'<.*?>', '', description)
-        
-        # Remove Medium-specific artifacts
-        clean = re.sub(r'Continue reading on.*$', '', clean)
-        clean = re.sub(r'Published in.*$', '', clean)
-        
-        # Clean whitespace
-        clean = ' '.join(clean.split())
-        
-        # Truncate if too long
-        return clean[:800] + '...' if len(clean) > 800 else clean
-    
-    def _calculate_relevance(self, title: str, description: str, tags: List[str]) -> float:
-        """Calculate relevance score based on your interests"""
-        score = 0.0
-        content = f"{title} {description}".lower()
-        
-        # High-value keywords for your interests
-        high_value_keywords = {
-            'ai': 1.0, 'artificial intelligence': 1.0, 'machine learning': 1.0,
-            'python': 0.8, 'programming': 0.6, 'coding': 0.6,
-            'career change': 0.9, 'career transition': 0.9,
-            'restaurant': 0.7, 'hospitality': 0.6,
-            'parenting': 0.8, 'family': 0.5,
-            'automation': 0.7, 'productivity': 0.6,
-            'learning': 0.5, 'education': 0.5,
-            'no-code': 0.8, 'low-code': 0.8,
-            'data science': 0.9, 'analytics': 0.6
-        }
-        
-        # Medium-value keywords
-        medium_value_keywords = {
-            'technology': 0.4, 'startup': 0.4, 'business': 0.3,
-            'innovation': 0.4, 'development': 0.3,
-            'leadership': 0.3, 'management': 0.4,
-            'beginner': 0.5, 'tutorial': 0.6, 'guide': 0.5
-        }
-        
-        # Check high-value keywords
-        for keyword, weight in high_value_keywords.items():
-            if keyword in content:
-                score += weight
-        
-        # Check medium-value keywords
-        for keyword, weight in medium_value_keywords.items():
-            if keyword in content:
-                score += weight
-        
-        # Bonus for practical content
-        practical_indicators = ['how to', 'step by step', 'tutorial', 'guide', 'tips']
-        if any(indicator in content for indicator in practical_indicators):
-            score += 0.3
-        
-        # Bonus for beginner-friendly content
-        beginner_indicators = ['beginner', 'getting started', 'introduction to', 'basics']
-        if any(indicator in content for indicator in beginner_indicators):
-            score += 0.2
-        
-        # Penalty for overly technical or advanced content
-        advanced_indicators = ['advanced', 'expert', 'deep dive', 'mathematical']
-        if any(indicator in content for indicator in advanced_indicators):
-            score -= 0.1
-        
-        return min(score, 2.0)  # Cap at 2.0
-    
-    def _extract_author(self, entry: Dict) -> str:
-        """Extract author name from Medium entry"""
-        author = entry.get('author', '')
-        if not author:
-            # Try to extract from other fields
-            authors = entry.get('authors', [])
-            if authors:
-                author = authors[0].get('name', '')
-        
-        return author if author else 'Unknown'
-    
-    def _extract_tags(self, entry: Dict) -> List[str]:
-        """Extract tags from Medium entry"""
-        tags = []
-        
-        # Try different tag fields
-        if 'tags' in entry:
-            for tag in entry['tags']:
-                if isinstance(tag, dict):
-                    tags.append(tag.get('term', ''))
-                else:
-                    tags.append(str(tag))
-        
-        # Extract from categories
-        if 'category' in entry:
-            tags.append(entry['category'])
-        
-        return [tag for tag in tags if tag]  # Remove empty tags
-    
-    def _categorize_article(self, title: str, description: str) -> str:
-        """Categorize Medium article"""
-        content = f"{title} {description}".lower()
-        
-        # AI/ML category
-        if any(term in content for term in ['ai', 'artificial intelligence', 'machine learning', 'deep learning', 'neural network']):
-            return 'ai_ml'
-        
-        # Programming category
-        elif any(term in content for term in ['python', 'programming', 'coding', 'software', 'development']):
-            return 'programming'
-        
-        # Career category
-        elif any(term in content for term in ['career', 'job', 'interview', 'resume', 'transition']):
-            return 'career'
-        
-        # Business category
-        elif any(term in content for term in ['business', 'startup', 'entrepreneurship', 'management']):
-            return 'business'
-        
-        # Learning category
-        elif any(term in content for term in ['learning', 'education', 'tutorial', 'course', 'skill']):
-            return 'learning'
-        
-        # Productivity category
-        elif any(term in content for term in ['productivity', 'automation', 'efficiency', 'tools']):
-            return 'productivity'
-        
-        # Personal category
-        elif any(term in content for term in ['parenting', 'family', 'personal', 'life']):
-            return 'personal'
-        
-        return 'general'
-    
-    def _estimate_reading_time(self, description: str) -> int:
-        """Estimate reading time in minutes"""
-        word_count = len(description.split())
-        # Assume 200 words per minute reading speed
-        return max(1, word_count // 200)
-    
-    def _is_member_only(self, entry: Dict) -> bool:
-        """Check if article requires Medium membership"""
-        # Look for member-only indicators in the content
-        content = str(entry).lower()
-        return 'member' in content or 'paywall' in content
-    
-    def _categorize_articles(self, articles: List[Dict]) -> Dict[str, int]:
-        """Count articles by category"""
-        categories = {}
-        for article in articles:
-            category = article.get('category', 'general')
-            categories[category] = categories.get(category, 0) + 1
-        return categories
-    
-    def _get_top_publications(self, articles: List[Dict]) -> Dict[str, int]:
-        """Get top publications by article count"""
-        publications = {}
-        for article in articles:
-            source = article.get('source', 'unknown')
-            if source.startswith('publication:'):
-                pub = source.replace('publication:', '')
-                publications[pub] = publications.get(pub, 0) + 1
-        
-        # Sort by count and return top 5
-        sorted_pubs = sorted(publications.items(), key=lambda x: x[1], reverse=True)
-        return dict(sorted_pubs[:5])
-
-# Example usage
-async def main():
-    collector = MediumCollector()
-    medium_data = await collector.collect_medium_content(hours_back=48)  # Longer window for Medium
-    
-    print(f"Collected {len(medium_data['articles'])} relevant articles")
-    print(f"Total found: {medium_data['total_found']}")
-    print("Categories:", medium_data['categories'])
-    print("Top publications:", medium_data['top_publications'])
-    
-    print("\nTop 5 articles:")
-    for i, article in enumerate(medium_data['articles'][:5]):
-        print(f"\n{i+1}. {article['title']}")
-        print(f"   Author: {article['author']}")
-        print(f"   Category: {article['category']}")
-        print(f"   Relevance: {article['relevance_score']:.2f}")
-        print(f"   Reading time: {article['reading_time']} min")
-
-if __name__ == "__main__":
+import asyncio
+import aiohttp
+import feedparser
+import json
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Set
+import heapq
+import io
+import logging
+import re
+from pathlib import Path
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+from ..utils.feed_dates import parse_feed_date
+from ..utils.keyword_matcher import build_keyword_matcher
+
+# High-value keywords for your interests
+HIGH_VALUE_KEYWORDS = {
+    'ai': 1.0, 'artificial intelligence': 1.0, 'machine learning': 1.0,
+    'python': 0.8, 'programming': 0.6, 'coding': 0.6,
+    'career change': 0.9, 'career transition': 0.9,
+    'restaurant': 0.7, 'hospitality': 0.6,
+    'parenting': 0.8, 'family': 0.5,
+    'automation': 0.7, 'productivity': 0.6,
+    'learning': 0.5, 'education': 0.5,
+    'no-code': 0.8, 'low-code': 0.8,
+    'data science': 0.9, 'analytics': 0.6
+}
+
+# Medium-value keywords
+MEDIUM_VALUE_KEYWORDS = {
+    'technology': 0.4, 'startup': 0.4, 'business': 0.3,
+    'innovation': 0.4, 'development': 0.3,
+    'leadership': 0.3, 'management': 0.4,
+    'beginner': 0.5, 'tutorial': 0.6, 'guide': 0.5
+}
+
+# Both weight tables in one lookup (their keywords don't overlap)
+_KEYWORD_WEIGHTS = {**HIGH_VALUE_KEYWORDS, **MEDIUM_VALUE_KEYWORDS}
+
+PRACTICAL_INDICATORS = frozenset({'how to', 'step by step', 'tutorial', 'guide', 'tips'})
+BEGINNER_INDICATORS = frozenset({'beginner', 'getting started', 'introduction to', 'basics'})
+ADVANCED_INDICATORS = frozenset({'advanced', 'expert', 'deep dive', 'mathematical'})
+
+# Checked in order; the first category with a matching term wins
+ARTICLE_CATEGORIES = (
+    ('ai_ml', frozenset({'ai', 'artificial intelligence', 'machine learning', 'deep learning', 'neural network'})),
+    ('programming', frozenset({'python', 'programming', 'coding', 'software', 'development'})),
+    ('career', frozenset({'career', 'job', 'interview', 'resume', 'transition'})),
+    ('business', frozenset({'business', 'startup', 'entrepreneurship', 'management'})),
+    ('learning', frozenset({'learning', 'education', 'tutorial', 'course', 'skill'})),
+    ('productivity', frozenset({'productivity', 'automation', 'efficiency', 'tools'})),
+    ('personal', frozenset({'parenting', 'family', 'personal', 'life'})),
+)
+
+# Entry fields kept in the feed cache; all that article building reads
+_CACHED_ENTRY_FIELDS = ('title', 'link', 'published', 'description', 'tags', 'author', 'authors')
+
+_DC_CREATOR = '{http://purl.org/dc/elements/1.1/}creator'
+_CONTENT_ENCODED = '{http://purl.org/rss/1.0/modules/content/}encoded'
+
+def _parse_feed(content: bytes) -> List[Dict]:
+    """Entries of a Medium feed, via the streaming RSS reader when possible, else feedparser"""
+    # Both parsers take the raw bytes and honour the document's declared encoding
+    if etree is not None:
+        try:
+            entries = _parse_rss_items(content)
+            if entries is not None:
+                return entries
+        except etree.XMLSyntaxError:
+            pass
+    return feedparser.parse(content).entries
+
+def _parse_rss_items(data: bytes) -> Optional[List[Dict]]:
+    """Read only the item fields the collector uses, in one streaming pass; None if not RSS"""
+    entries = []
+    context = etree.iterparse(io.BytesIO(data), events=('end',), tag='item', resolve_entities=False)
+    for _, item in context:
+        entry = {
+            'title': item.findtext('title', ''),
+            'link': item.findtext('link', ''),
+            'published': item.findtext('pubDate', ''),
+            # Medium puts the article body in content:encoded and has no description
+            'description': item.findtext('description') or item.findtext(_CONTENT_ENCODED, ''),
+            'tags': [{'term': category.text} for category in item.iterfind('category') if category.text]
+        }
+        author = item.findtext(_DC_CREATOR)
+        if author:
+            entry['author'] = author
+        entries.append(entry)
+        
+        # Drop parsed items so memory stays flat on long feeds
+        item.clear(keep_tail=True)
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+    
+    if context.root is None or context.root.tag != 'rss':
+        return None
+    return entries
+
+_RE_HTML = re.compile(r'<.*?>')
+_RE_CONTINUE = re.compile(r'Continue reading on.*$')
+_RE_PUBLISHED = re.compile(r'Published in.*$')
+
+# Maps lowercase text to the frozenset of keywords it contains; relevance
+# scoring and categorization look up the same text back to back
+_match_keywords = build_keyword_matcher({keyword: (keyword,) for keyword in (
+    HIGH_VALUE_KEYWORDS.keys() | MEDIUM_VALUE_KEYWORDS.keys()
+    | PRACTICAL_INDICATORS | BEGINNER_INDICATORS | ADVANCED_INDICATORS
+    | frozenset().union(*(terms for _, terms in ARTICLE_CATEGORIES))
+)})
+
+class MediumCollector:
+    # Every feed is on medium.com; more parallel requests than this risk 429s
+    MAX_CONCURRENT_FEEDS = 6
+    
+    def __init__(self, cache_path: str = "data/medium_feed_cache.json"):
+        self.base_url = "https://medium.com/feed"
+        self.session = None
+        self._feed_limiter: Optional[asyncio.Semaphore] = None
+        
+        # url -> ETag, Last-Modified and entries of the last full fetch, for
+        # conditional requests; loaded from cache_path on first use
+        self.cache_path = Path(cache_path)
+        self._feed_cache: Optional[Dict[str, Dict]] = None
+        
+        # Your specific interests for filtering
+        self.interest_topics = [
+            'machine-learning', 'artificial-intelligence', 'python', 
+            'data-science', 'programming', 'software-development',
+            'no-code', 'low-code', 'automation', 'productivity',
+            'parenting', 'learning', 'career-change', 'restaurant-management'
+        ]
+        
+        # Popular AI/ML publications on Medium
+        self.publications = [
+            'towards-data-science',
+            'towardsmachinelearning', 
+            'the-artificial-intelligence-publication',
+            'analytics-vidhya',
+            'better-programming',
+            'python-in-plain-english',
+            'the-startup',
+            'hackernoon',
+            'freecodecamp'
+        ]
+    
+    async def __aenter__(self) -> "MediumCollector":
+        """Open one session to reuse across collect_medium_content calls"""
+        if self.session is None or self.session.closed:
+            self.session = self._create_session()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the HTTP session and its pooled connections"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+    
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Keep-alive session; every feed is on medium.com, so connections are reused"""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=50, limit_per_host=self.MAX_CONCURRENT_FEEDS, ttl_dns_cache=300, keepalive_timeout=60
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers={
+                'User-Agent': 'MorningDigest/1.0 (Personal Content Aggregator)',
+                'Accept-Encoding': 'gzip, deflate'
+            }
+        )
+    
+    async def collect_medium_content(self, hours_back: int = 24) -> Dict[str, Any]:
+        """Collect Medium articles from various sources"""
+        # Outside `async with`, use a session for this call only
+        owns_session = self.session is None or self.session.closed
+        if owns_session:
+            self.session = self._create_session()
+        try:
+            cutoff_time = datetime.now() - timedelta(hours=hours_back)
+            unique_articles = []
+            
+            # Topic and publication feeds overlap heavily; each URL is scored
+            # only by the first feed that reaches it
+            seen_urls: Set[str] = set()
+            
+            # Requests wait here rather than in the connection pool, where the
+            # wait would count against each request's 30s timeout
+            self._feed_limiter = asyncio.Semaphore(self.MAX_CONCURRENT_FEEDS)
+            if self._feed_cache is None:
+                self._feed_cache = self._load_feed_cache()
+            
+            # Collect from different sources in parallel
+            tasks = []
+            
+            # Topic-based feeds
+            for topic in self.interest_topics:
+                tasks.append(self._fetch_topic_feed(topic, cutoff_time, seen_urls))
+            
+            # Publication feeds
+            for pub in self.publications:
+                tasks.append(self._fetch_publication_feed(pub, cutoff_time, seen_urls))
+            
+            # Execute all tasks
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Process results
+            for i, result in enumerate(results):
+                if isinstance(result, Exception):
+                    logging.error(f"Failed to fetch Medium content: {result}")
+                    continue
+                
+                if result:
+                    unique_articles.extend(result)
+            
+            self._store_feed_cache()
+            
+            # Top 50 by relevance and recency, without sorting the rest
+            top_articles = heapq.nlargest(50, unique_articles, key=lambda x: (
+                x.get('relevance_score', 0),
+                x.get('published_timestamp', 0)
+            ))
+            
+            return {
+                'articles': top_articles,
+                'total_found': len(unique_articles),
+                'collection_time': datetime.now().isoformat(),
+                'categories': self._categorize_articles(unique_articles),
+                'top_publications': self._get_top_publications(unique_articles)
+            }
+        finally:
+            if owns_session:
+                await self.close()
+    
+    async def _fetch_topic_feed(self, topic: str, cutoff_time: datetime, seen_urls: Set[str]) -> List[Dict]:
+        """Fetch articles from Medium topic feed"""
+        url = f"{self.base_url}/tag/{topic}"
+        return await self._fetch_feed(url, cutoff_time, f"topic:{topic}", seen_urls)
+    
+    async def _fetch_publication_feed(self, publication: str, cutoff_time: datetime, seen_urls: Set[str]) -> List[Dict]:
+        """Fetch articles from Medium publication feed"""
+        url = f"{self.base_url}/@{publication}"
+        return await self._fetch_feed(url, cutoff_time, f"publication:{publication}", seen_urls)
+    
+    async def _fetch_feed(self, url: str, cutoff_time: datetime, source: str, seen_urls: Set[str]) -> List[Dict]:
+        """Generic RSS feed fetcher for Medium"""
+        try:
+            entries = await self._fetch_entries(url)
+            
+            articles = []
+            
+            for entry in entries:
+                # Already handled via another feed (no await below, so the
+                # check and add can't interleave with other feeds)
+                link = entry.get('link', '')
+                if link in seen_urls:
+                    continue
+                seen_urls.add(link)
+                
+                # Parse publication date
+                published = self._parse_date(entry.get('published', ''))
+                if published and published < cutoff_time:
+                    continue
+                
+                # Extract and clean content
+                description = self._clean_description(entry.get('description', ''))
+                
+                # Calculate relevance score
+                relevance = self._calculate_relevance(
+                    entry.get('title', ''),
+                    description,
+                    entry.get('tags', [])
+                )
+                
+                if relevance > 0.3:  # Only include relevant articles
+                    article = {
+                        'title': entry.get('title', 'No title'),
+                        'description': description,
+                        'url': link,
+                        'author': self._extract_author(entry),
+                        'published': entry.get('published', ''),
+                        'published_timestamp': published.timestamp() if published else 0,
+                        'tags': self._extract_tags(entry),
+                        'source': source,
+                        'relevance_score': relevance,
+                        'reading_time': self._estimate_reading_time(description),
+                        'category': self._categorize_article(entry.get('title', ''), description),
+                        'is_member_only': self._is_member_only(entry)
+                    }
+                    articles.append(article)
+            
+            logging.info(f"Collected {len(articles)} relevant articles from {source}")
+            return articles
+            
+        except Exception as e:
+            logging.error(f"Error fetching Medium feed {url}: {e}")
+            return []
+    
+    async def _fetch_entries(self, url: str) -> List[Dict]:
+        """Feed entries for url, revalidating the previous copy with ETag/Last-Modified"""
+        headers = {}
+        cached = self._feed_cache.get(url)
+        if cached is not None:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        async with self._feed_limiter, self.session.get(url, headers=headers) as response:
+            # Unchanged since last fetch: reuse the parsed entries, skipping download and parse
+            if response.status == 304 and cached is not None:
+                return cached['entries']
+            if response.status != 200:
+                logging.warning(f"HTTP {response.status} for {url}")
+                return []
+            
+            # Undecoded body; the parser detects the encoding itself
+            content = await response.read()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+        
+        # Parsing is CPU-bound; do it in a worker thread so other feeds' I/O keeps flowing
+        parsed = await asyncio.get_running_loop().run_in_executor(None, _parse_feed, content)
+        entries = [{field: entry[field] for field in _CACHED_ENTRY_FIELDS if field in entry} for entry in parsed]
+        if etag or last_modified:
+            self._feed_cache[url] = {'etag': etag, 'last_modified': last_modified, 'entries': entries}
+        else:
+            self._feed_cache.pop(url, None)
+        return entries
+    
+    def _load_feed_cache(self) -> Dict[str, Dict]:
+        """Feed cache written by an earlier run, or an empty one"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logging.warning(f"Medium feed cache read failed: {e}")
+            return {}
+    
+    def _store_feed_cache(self) -> None:
+        """Persist the feed cache for the next run, dropping feeds no longer followed"""
+        urls = {f"{self.base_url}/tag/{topic}" for topic in self.interest_topics}
+        urls.update(f"{self.base_url}/@{publication}" for publication in self.publications)
+        cache = {url: entry for url, entry in self._feed_cache.items() if url in urls}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+        except Exception as e:
+            logging.warning(f"Medium feed cache write failed: {e}")
+    
+    def _parse_date(self, date_str: str) -> Optional[datetime]:
+        """Parse Medium's date format"""
+        if not date_str:
+            return None
+        
+        published = parse_feed_date(date_str)
+        if published is None:
+            logging.warning(f"Could not parse Medium date: {date_str}")
+            return datetime.now()
+        return published
+    
+    def _clean_description(self, description: str) -> str:
+        """Clean Medium article description"""
+        # Remove HTML tags
+        clean = _RE_HTML.sub('', description)
+        
+        # Remove Medium-specific artifacts
+        clean = _RE_CONTINUE.sub('', clean)
+        clean = _RE_PUBLISHED.sub('', clean)
+        
+        # Clean whitespace
+        clean = ' '.join(clean.split())
+        
+        # Truncate if too long
+        return clean[:800] + '...' if len(clean) > 800 else clean
+    
+    def _calculate_relevance(self, title: str, description: str, tags: List[str]) -> float:
+        """Calculate relevance score based on your interests"""
+        hits = _match_keywords(f"{title} {description}".lower())
+        
+        # Keyword weights
+        score = sum(_KEYWORD_WEIGHTS[keyword] for keyword in hits & _KEYWORD_WEIGHTS.keys())
+        
+        # Bonus for practical content
+        if not PRACTICAL_INDICATORS.isdisjoint(hits):
+            score += 0.3
+        
+        # Bonus for beginner-friendly content
+        if not BEGINNER_INDICATORS.isdisjoint(hits):
+            score += 0.2
+        
+        # Penalty for overly technical or advanced content
+        if not ADVANCED_INDICATORS.isdisjoint(hits):
+            score -= 0.1
+        
+        return min(score, 2.0)  # Cap at 2.0
+    
+    def _extract_author(self, entry: Dict) -> str:
+        """Extract author name from Medium entry"""
+        author = entry.get('author', '')
+        if not author:
+            # Try to extract from other fields
+            authors = entry.get('authors', [])
+            if authors:
+                author = authors[0].get('name', '')
+        
+        return author if author else 'Unknown'
+    
+    def _extract_tags(self, entry: Dict) -> List[str]:
+        """Extract tags from Medium entry"""
+        # Both parsers give tags as dicts with a 'term'; feedparser's 'category'
+        # is just the first of them again
+        return [tag['term'] for tag in entry.get('tags', ()) if tag.get('term')]
+    
+    def _categorize_article(self, title: str, description: str) -> str:
+        """Categorize Medium article"""
+        # Same text as _calculate_relevance, so this is a cache hit
+        hits = _match_keywords(f"{title} {description}".lower())
+        for category, terms in ARTICLE_CATEGORIES:
+            if not terms.isdisjoint(hits):
+                return category
+        
+        return 'general'
+    
+    def _estimate_reading_time(self, description: str) -> int:
+        """Estimate reading time in minutes"""
+        word_count = len(description.split())
+        # Assume 200 words per minute reading speed
+        return max(1, word_count // 200)
+    
+    def _is_member_only(self, entry: Dict) -> bool:
+        """Check if article requires Medium membership"""
+        # Medium marks these with a tag or a "Member-only story" label; check
+        # those fields rather than stringifying the whole entry
+        for tag in entry.get('tags', []):
+            term = (tag.get('term') or '').lower()
+            if 'member' in term or 'paywall' in term:
+                return True
+        return any('member-only' in entry.get(field, '').lower() for field in ('title', 'description'))
+    
+    def _categorize_articles(self, articles: List[Dict]) -> Dict[str, int]:
+        """Count articles by category"""
+        categories = {}
+        for article in articles:
+            category = article.get('category', 'general')
+            categories[category] = categories.get(category, 0) + 1
+        return categories
+    
+    def _get_top_publications(self, articles: List[Dict]) -> Dict[str, int]:
+        """Get top publications by article count"""
+        publications = {}
+        for article in articles:
+            source = article.get('source', 'unknown')
+            if source.startswith('publication:'):
+                pub = source.replace('publication:', '')
+                publications[pub] = publications.get(pub, 0) + 1
+        
+        # Sort by count and return top 5
+        sorted_pubs = sorted(publications.items(), key=lambda x: x[1], reverse=True)
+        return dict(sorted_pubs[:5])
+
+# Example usage
+async def main():
+    async with MediumCollector() as collector:
+        medium_data = await collector.collect_medium_content(hours_back=48)  # Longer window for Medium
+    
+    print(f"Collected {len(medium_data['articles'])} relevant articles")
+    print(f"Total found: {medium_data['total_found']}")
+    print("Categories:", medium_data['categories'])
+    print("Top publications:", medium_data['top_publications'])
+    
+    print("\nTop 5 articles:")
+    for i, article in enumerate(medium_data['articles'][:5]):
+        print(f"\n{i+1}. {article['title']}")
+        print(f"   Author: {article['author']}")
+        print(f"   Category: {article['category']}")
+        print(f"   Relevance: {article['relevance_score']:.2f}")
+        print(f"   Reading time: {article['reading_time']} min")
+
+if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -34,6 +34,7 @@ try:
 except ImportError as e:
     MasterCoordinatorAgent = None
     print(f"Warning: MasterCoordinatorAgent unavailable: {e}")
+from ..agents.base_agent import AgentError
 from ..utils.error_handler import ErrorHandler, ErrorSeverity
 from ..utils.token_counter import TokenCounter
 from ..utils.config_loader import ConfigLoader
@@ -159,7 +160,8 @@ class AgentCoordinator:
         self.logger.info(f"Agent processing completed. Processed: {list(agent_results.keys())}")
         return agent_results
 
-    async def _process_with_agent(self, agent_name: str, data: Any, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _process_with_agent(self, agent_name: str, data: Any, context: Dict[str, Any],
+                                  use_cache: bool = True) -> Dict[str, Any]:
         """Process data with a specific agent"""
         try:
             agent = self.agents[agent_name]
@@ -180,7 +182,10 @@ class AgentCoordinator:
             
             # Process with agent
             self.logger.info(f"Processing with {agent_name}")
-            result = await agent.process(data, context)
+            result = await agent.process(data, context, use_cache=use_cache)
+            if isinstance(result, AgentError):
+                self.logger.error(f"Agent {agent_name} failed: {result.message}")
+                return {'agent': agent_name, 'data': None, 'error': result.message}
             
             self.logger.info(f"Successfully processed with {agent_name}")
             return {'agent': agent_name, 'data': result, 'error': None}
@@ -245,6 +250,9 @@ class AgentCoordinator:
             
             self.logger.info("Running master coordinator for final digest")
             final_digest = await master_agent.process(coordinator_input, context)
+            if isinstance(final_digest, AgentError):
+                self.logger.error(f"Master coordinator failed: {final_digest.message}")
+                return self._create_simple_digest_fallback(agent_results)
             
             return final_digest
             
@@ -306,8 +314,15 @@ class AgentCoordinator:
             'overall_status': 'healthy'
         }
         
-        # Check each agent
+        # Check each agent; health checks run concurrently
         failed_agents = 0
+        live_agents = {name: agent for name, agent in self.agents.items() if agent is not None}
+        health_results = await asyncio.gather(
+            *(self._test_agent_health(name, agent) for name, agent in live_agents.items()),
+            return_exceptions=True
+        )
+        health_by_agent = dict(zip(live_agents, health_results))
+        
         for name, agent in self.agents.items():
             if agent is None:
                 status['agents'][name] = {
@@ -316,23 +331,21 @@ class AgentCoordinator:
                 }
                 failed_agents += 1
             else:
-                # Try to perform a simple health check
-                try:
-                    # Simple test with minimal data
-                    test_result = await self._test_agent_health(name, agent)
+                test_result = health_by_agent[name]
+                if isinstance(test_result, Exception):
                     status['agents'][name] = {
-                        'status': 'healthy' if test_result else 'unhealthy',
+                        'status': 'error',
+                        'error': str(test_result),
                         'last_check': datetime.now().isoformat()
                     }
-                    if not test_result:
-                        failed_agents += 1
-                except Exception as e:
+                    failed_agents += 1
+                else:
                     status['agents'][name] = {
-                        'status': 'error',
-                        'error': str(e),
+                        'status': 'healthy' if test_result else 'unhealthy',
                         'last_check': datetime.now().isoformat()
                     }
-                    failed_agents += 1
+                    if not test_result:
+                        failed_agents += 1
         
         # Determine overall status
         total_agents = len(self.agents)
@@ -355,14 +368,14 @@ class AgentCoordinator:
             test_data = {'test': True, 'health_check': True}
             test_context = {'test_mode': True}
             
-            # Try processing with timeout
+            # Try processing with timeout; bypass the response cache so the API is really reached
             result = await asyncio.wait_for(
-                agent.process(test_data, test_context),
+                agent.process(test_data, test_context, use_cache=False),
                 timeout=10.0
             )
             
             # Check if result is valid
-            return isinstance(result, dict) and not result.get('error')
+            return not isinstance(result, AgentError)
             
         except asyncio.TimeoutError:
             self.logger.warning(f"Health check timeout for {agent_name}")
@@ -371,7 +384,8 @@ class AgentCoordinator:
             self.logger.warning(f"Health check failed for {agent_name}: {e}")
             return False
 
-    async def process_single_agent(self, agent_name: str, data: Any, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def process_single_agent(self, agent_name: str, data: Any, context: Dict[str, Any],
+                                   use_cache: bool = True) -> Dict[str, Any]:
         """Process data with a single agent (for testing/debugging)"""
         if agent_name not in self.agents:
             return {'error': f'Unknown agent: {agent_name}', 'data': None}
@@ -380,7 +394,7 @@ class AgentCoordinator:
         if not agent:
             return {'error': f'Agent {agent_name} not initialized', 'data': None}
         
-        return await self._process_with_agent(agent_name, data, context)
+        return await self._process_with_agent(agent_name, data, context, use_cache=use_cache)
 
     def get_agent_info(self) -> Dict[str, Any]:
         """Get information about all available agents"""
@@ -0,0 +1,37 @@
+import functools
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Tried in order when a date is neither RFC 2822 nor ISO 8601
+_FALLBACK_DATE_FORMATS = [
+    '%a, %d %b %Y %H:%M:%S %z',
+    '%a, %d %b %Y %H:%M:%S %Z',
+    '%Y-%m-%dT%H:%M:%S%z',
+    '%Y-%m-%d %H:%M:%S',
+    '%a, %d %b %Y %H:%M:%S GMT',
+    '%a, %d %b %Y %H:%M:%S',
+]
+
+# Entries of one feed often share timestamps, and feeds repeat between runs
+@functools.lru_cache(maxsize=4096)
+def parse_feed_date(date_str: str) -> Optional[datetime]:
+    """RSS/Atom date as naive local time, None if unparseable"""
+    try:
+        parsed = parsedate_to_datetime(date_str)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(date_str[:-1] + '+00:00' if date_str.endswith('Z') else date_str)
+        except ValueError:
+            for fmt in _FALLBACK_DATE_FORMATS:
+                try:
+                    parsed = datetime.strptime(date_str, fmt)
+                    break
+                except ValueError:
+                    continue
+            else:
+                return None
+    # Callers compare against naive datetime.now()
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
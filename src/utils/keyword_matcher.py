@@ -0,0 +1,60 @@
+import functools
+import re
+from collections import defaultdict
+from typing import Callable, Dict, FrozenSet, Iterable
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+def keyword_pattern(keywords: Iterable[str], ignore_case: bool = False, whole_word_max_len: int = 0) -> "re.Pattern":
+    """One compiled alternation matching any keyword as a substring, like any(k in text)"""
+    # Keywords up to whole_word_max_len characters must be whole words
+    # instead, e.g. 'ai' should not hit every text containing 'said'
+    alternatives = [
+        rf'\b{re.escape(keyword)}\b' if len(keyword) <= whole_word_max_len else re.escape(keyword)
+        for keyword in sorted(keywords, key=len, reverse=True)
+    ]
+    return re.compile('|'.join(alternatives), re.IGNORECASE if ignore_case else 0)
+
+def build_keyword_matcher(groups: Dict[str, Iterable[str]], cache_size: int = 256) -> Callable[[str], FrozenSet[str]]:
+    """Return a function mapping text to the frozenset of group names with a keyword in it, like k in text"""
+    groups_by_word = defaultdict(set)
+    for group, words in groups.items():
+        for word in words:
+            groups_by_word[word].add(group)
+    
+    if ahocorasick is not None:
+        # Single pass over the text for all groups
+        automaton = ahocorasick.Automaton()
+        for word, word_groups in groups_by_word.items():
+            automaton.add_word(word, frozenset(word_groups))
+        automaton.make_automaton()
+        
+        def match(text: str) -> FrozenSet[str]:
+            hits = set()
+            for _, word_groups in automaton.iter(text):
+                hits |= word_groups
+            return frozenset(hits)
+    else:
+        # Without pyahocorasick: one alternation tried at every position
+        # (zero-width lookahead, so matches may overlap). It reports the longest
+        # keyword starting there; shorter keywords that are its prefixes start
+        # there too, so their groups come from a precomputed table
+        ordered = sorted(groups_by_word, key=len, reverse=True)
+        pattern = re.compile('(?=(' + '|'.join(re.escape(word) for word in ordered) + '))')
+        groups_by_prefix = {
+            word: frozenset().union(*(groups_by_word[p] for p in ordered if word.startswith(p)))
+            for word in ordered
+        }
+        
+        def match(text: str) -> FrozenSet[str]:
+            hits = set()
+            for found in pattern.finditer(text):
+                hits |= groups_by_prefix[found.group(1)]
+            return frozenset(hits)
+    
+    # Callers look up the same texts repeatedly (recurring events, scoring
+    # then categorizing one article)
+    return functools.lru_cache(maxsize=cache_size)(match)
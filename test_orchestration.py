@@ -1,51 +1,51 @@
-#!/usr/bin/env python3
-"""
-Simple test to verify orchestration structure
-"""
-
-def test_imports():
-    """Test that our orchestration classes can be imported structurally"""
-    try:
-        # Test import paths exist
-        import src.orchestration
-        print("✅ Orchestration package structure OK")
-        
-        # Test class definitions exist (without instantiating)
-        from src.orchestration.digest_orchestrator import DigestOrchestrator
-        from src.orchestration.agent_coordinator import AgentCoordinator
-        print("✅ Core orchestration classes defined")
-        
-        # Test main CLI structure
-        import src.main
-        print("✅ Main CLI module structure OK")
-        
-        return True
-        
-    except ImportError as e:
-        print(f"❌ Import error: {e}")
-        return False
-    except SyntaxError as e:
-        print(f"❌ Syntax error: {e}")
-        return False
-    except Exception as e:
-        print(f"❌ Other error: {e}")
-        return False
-
-if __name__ == "__main__":
-    print("🧪 Testing orchestration structure...")
-    success = test_imports()
-    
-    if success:
-        print("\n✅ All orchestration components are structurally sound!")
-        print("\n📋 Implemented components:")
-        print("  • DigestOrchestrator - Main coordination layer")
-        print("  • AgentCoordinator - AI agent management")  
-        print("  • CLI interface with commands: generate, health, status, test-agents, send-email")
-        print("  • Async/await architecture for performance")
-        print("  • Comprehensive error handling and token management")
-        print("  • Norwegian context integration")
-        print("  • Graceful degradation for partial failures")
-    else:
-        print("\n❌ Issues found in orchestration structure")
-        
+#!/usr/bin/env python3
+"""
+Simple test to verify orchestration structure
+"""
+
+def test_imports():
+    """Test that our orchestration classes can be imported structurally"""
+    try:
+        # Test import paths exist
+        import src.orchestration
+        print("✅ Orchestration package structure OK")
+        
+        # Test class definitions exist (without instantiating)
+        from src.orchestration.digest_orchestrator import DigestOrchestrator
+        from src.orchestration.agent_coordinator import AgentCoordinator
+        print("✅ Core orchestration classes defined")
+        
+        # Test main CLI structure
+        import src.main
+        print("✅ Main CLI module structure OK")
+        
+        return True
+        
+    except ImportError as e:
+        print(f"❌ Import error: {e}")
+        return False
+    except SyntaxError as e:
+        print(f"❌ Syntax error: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Other error: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("🧪 Testing orchestration structure...")
+    success = test_imports()
+    
+    if success:
+        print("\n✅ All orchestration components are structurally sound!")
+        print("\n📋 Implemented components:")
+        print("  • DigestOrchestrator - Main coordination layer")
+        print("  • AgentCoordinator - AI agent management")  
+        print("  • CLI interface with commands: generate, health, status, test-agents, send-email")
+        print("  • Async/await architecture for performance")
+        print("  • Comprehensive error handling and token management")
+        print("  • Norwegian context integration")
+        print("  • Graceful degradation for partial failures")
+    else:
+        print("\n❌ Issues found in orchestration structure")
+        
     exit(0 if success else 1)
\ No newline at end of file
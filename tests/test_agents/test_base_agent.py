@@ -0,0 +1,55 @@
+import asyncio
+import logging
+
+import pytest
+
+from src.agents.base_agent import BaseAgent
+from src.agents.llm_cache import LLMCache, MemoryBackend
+from src.orchestration.agent_coordinator import AgentCoordinator
+
+
+class FakeAgent(BaseAgent):
+    def __init__(self):
+        super().__init__("Fake", "You are a test agent.", "test-key")
+        self.api_calls = 0
+
+    async def _stream_text(self, user_content, max_tokens=1000, prefill=None):
+        self.api_calls += 1
+        yield "ok"
+
+
+@pytest.fixture(autouse=True)
+def memory_cache(monkeypatch):
+    """Keep tests away from the shared SQLite cache in data/"""
+    monkeypatch.setattr(BaseAgent, "llm_cache", LLMCache([MemoryBackend()]))
+
+
+def test_process_answers_repeated_input_from_cache():
+    agent = FakeAgent()
+    data = {'content': 'same input'}
+
+    first = asyncio.run(agent.process(data))
+    second = asyncio.run(agent.process(data))
+
+    assert first == second == {"analysis": "ok"}
+    assert agent.api_calls == 1
+
+
+def test_process_without_cache_always_calls_api():
+    agent = FakeAgent()
+    data = {'content': 'same input'}
+
+    asyncio.run(agent.process(data))
+    asyncio.run(agent.process(data, use_cache=False))
+
+    assert agent.api_calls == 2
+
+
+def test_health_check_reaches_api_every_time():
+    coordinator = AgentCoordinator.__new__(AgentCoordinator)
+    coordinator.logger = logging.getLogger('test_agent_coordinator')
+    agent = FakeAgent()
+
+    assert asyncio.run(coordinator._test_agent_health('fake', agent))
+    assert asyncio.run(coordinator._test_agent_health('fake', agent))
+    assert agent.api_calls == 2
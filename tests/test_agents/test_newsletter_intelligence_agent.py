@@ -0,0 +1,28 @@
+from src.agents.newsletter_intelligence_agent import NewsletterIntelligenceAgent
+
+
+def newsletter(message_id, date, subject='Your daily digest'):
+    return {'message_id': message_id, 'sender': 'Digest <digest@example.com>', 'sender_email': 'digest@example.com',
+            'subject': subject, 'date': date, 'content': f'Issue {message_id}'}
+
+
+def test_issues_sharing_a_subject_are_all_kept():
+    agent = NewsletterIntelligenceAgent("test-key")
+    data = {'newsletters': [
+        newsletter('a1', 'Wed, 14 Oct 2026 06:00:00 +0000'),
+        newsletter('a2', 'Thu, 15 Oct 2026 06:00:00 +0000'),
+    ]}
+
+    prompt = agent._format_input(data, None)
+
+    assert 'Issue a1' in prompt and 'Issue a2' in prompt
+
+
+def test_duplicate_copies_of_one_message_are_dropped():
+    agent = NewsletterIntelligenceAgent("test-key")
+    date = 'Thu, 15 Oct 2026 06:00:00 +0000'
+    data = {'newsletters': [newsletter('b2', date), newsletter('b1', date)]}
+
+    prompt = agent._format_input(data, None)
+
+    assert 'Issue b1' in prompt and 'Issue b2' not in prompt
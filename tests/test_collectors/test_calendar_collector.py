@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.collectors.calendar_collector import CalendarCollector
+
+
+def make_collector():
+    collector = CalendarCollector("credentials.json")
+    collector._set_clock()
+    return collector
+
+
+def timed_event(start: datetime, minutes: int = 60, **fields):
+    end = start + timedelta(minutes=minutes)
+    return dict({'id': 'timed', 'summary': 'Møte', 'start': {'dateTime': start.isoformat()},
+                 'end': {'dateTime': end.isoformat()}}, **fields)
+
+
+def all_day_event(day, **fields):
+    return dict({'id': 'all-day', 'summary': 'Bursdag', 'start': {'date': day.isoformat()},
+                 'end': {'date': (day + timedelta(days=1)).isoformat()}}, **fields)
+
+
+def test_timed_event_becomes_naive_local_time():
+    collector = make_collector()
+    start = datetime(2024, 6, 3, 9, 30, tzinfo=timezone(timedelta(hours=2)))
+
+    event = collector._format_event(timed_event(start), 'primary', 'Work')
+
+    assert event['start_datetime'].tzinfo is None
+    assert event['start_datetime'] == start.astimezone().replace(tzinfo=None)
+    assert event['duration_minutes'] == 60
+
+
+def test_timed_and_all_day_events_sort_and_categorize_together():
+    collector = make_collector()
+    today = collector._today_start
+    offset = timezone(timedelta(hours=2))
+    # Noon local today, expressed with a +02:00 offset as Google returns it
+    today_noon = (today + timedelta(hours=12)).astimezone(offset)
+    raw_events = [
+        timed_event(today_noon + timedelta(days=2), id='later'),
+        all_day_event(today.date(), id='today-all-day'),
+        timed_event(today_noon, id='today-timed'),
+        all_day_event(today.date() + timedelta(days=10), id='next-month'),
+    ]
+
+    events = [collector._format_event(event, 'primary', 'Family') for event in raw_events]
+    assert all(event is not None for event in events)
+    events.sort(key=lambda x: x.get('start_datetime', datetime.min))
+    categorized = collector._categorize_events(events)
+
+    assert [event['id'] for event in categorized['today']] == ['today-all-day', 'today-timed']
+    assert [event['id'] for event in categorized['this_week']] == ['later']
+
+
+
+def test_categorize_rejects_timezone_aware_start_times():
+    collector = make_collector()
+    event = {'id': 'aware', 'start_datetime': datetime.now(timezone.utc)}
+
+    with pytest.raises(ValueError, match="naive local time"):
+        collector._categorize_events([event])
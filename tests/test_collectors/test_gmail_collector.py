@@ -0,0 +1,58 @@
+import asyncio
+import itertools
+
+from src.collectors.gmail_collector import GmailCollector, NEWSLETTER_THRESHOLD
+
+
+def make_collector(tmp_path):
+    return GmailCollector("credentials.json", cache_path=str(tmp_path / "cache.sqlite3"))
+
+
+def metadata(sender: str, subject: str):
+    return {'payload': {'headers': [{'name': 'From', 'value': sender}, {'name': 'Subject', 'value': subject}]}}
+
+
+# One text per signal, with and without it
+SENDERS = ['Ola Nordmann <ola@example.com>', 'Tech Weekly <newsletter@example.com>']
+SUBJECTS = ['Middag på fredag?', 'Your weekly roundup']
+CONTENTS = [
+    'Hei, ses vi?',
+    'Click here to unsubscribe',
+    'View in browser',
+    'View in browser ... unsubscribe',
+]
+
+
+def test_metadata_prefilter_keeps_every_message_the_full_score_keeps(tmp_path):
+    collector = make_collector(tmp_path)
+    for sender, subject, content in itertools.product(SENDERS, SUBJECTS, CONTENTS):
+        if collector._calculate_newsletter_score(sender, subject, content) > NEWSLETTER_THRESHOLD:
+            assert collector._may_be_newsletter(metadata(sender, subject)), (sender, subject, content)
+
+
+def test_metadata_prefilter_drops_plain_mail(tmp_path):
+    collector = make_collector(tmp_path)
+    assert not collector._may_be_newsletter(metadata(SENDERS[0], SUBJECTS[0]))
+
+
+def test_unreadable_message_is_not_cached_as_rejected(tmp_path):
+    collector = make_collector(tmp_path)
+    collector.service = object()
+
+    async def get_messages(queries):
+        return ['broken']
+
+    async def get_message_details(message_ids, message_format='raw', metadata_headers=None):
+        if message_format == 'metadata':
+            return {}
+        return {msg_id: {'id': msg_id, 'raw': None} for msg_id in message_ids}
+
+    collector._get_messages = get_messages
+    collector._get_message_details = get_message_details
+
+    result = asyncio.run(collector.collect_newsletters())
+
+    assert result['count'] == 0
+    # A later run must fetch the message again rather than treat it as rejected
+    assert collector._load_cached_results(['broken']) == {}
+
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import feedparser
+import pytest
+
+from src.collectors import medium_collector
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures"
+
+COMPARED_FIELDS = ('title', 'link', 'published', 'description', 'author')
+
+
+def comparable(entry):
+    """The entry fields MediumCollector reads, in a form both parsers can be compared on"""
+    fields = {field: entry.get(field) for field in COMPARED_FIELDS}
+    fields['tags'] = [tag['term'] for tag in entry.get('tags', [])]
+    return fields
+
+
+@pytest.mark.parametrize('fixture', ['medium_rss_feed.xml', 'medium_atom_feed.xml'])
+def test_parse_feed_matches_feedparser(fixture):
+    content = (FIXTURES / fixture).read_bytes()
+
+    entries = medium_collector._parse_feed(content)
+    expected = feedparser.parse(content).entries
+
+    assert entries
+    assert [comparable(entry) for entry in entries] == [comparable(entry) for entry in expected]
+
+
+@pytest.mark.skipif(medium_collector.etree is None, reason="lxml not installed")
+def test_streaming_reader_handles_rss_only():
+    assert medium_collector._parse_rss_items((FIXTURES / 'medium_rss_feed.xml').read_bytes()) is not None
+    # Atom falls back to feedparser
+    assert medium_collector._parse_rss_items((FIXTURES / 'medium_atom_feed.xml').read_bytes()) is None
+
+
+def test_parse_feed_returns_no_entries_for_malformed_input():
+    assert medium_collector._parse_feed(b'<html><body>Rate limited</p>') == []
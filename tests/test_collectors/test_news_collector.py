@@ -0,0 +1,161 @@
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from src.collectors.news_collector import NewsCollector
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures"
+
+FEED_URL = "https://www.nrk.no/trondelag/toppsaker.rss"
+SOURCES = {"norwegian_local": [{"name": "NRK Trøndelag", "rss": FEED_URL, "priority": "high"}]}
+
+ETAG = '"v1"'
+LAST_MODIFIED = 'Thu, 15 Oct 2026 07:31:00 GMT'
+
+
+class FakeResponse:
+    def __init__(self, status, body=b'', headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        self.read_count = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def read(self):
+        self.read_count += 1
+        return self.body
+
+
+class FakeSession:
+    """Serves the fixture feed, answering 304 to a request carrying its ETag"""
+
+    def __init__(self, validators=True):
+        self.validators = validators
+        self.requests = []
+        self.responses = []
+        self.closed = False
+
+    def get(self, url, headers=None):
+        headers = headers or {}
+        self.requests.append((url, headers))
+        if self.validators and headers.get('If-None-Match') == ETAG:
+            response = FakeResponse(304)
+        else:
+            response_headers = {'Content-Type': 'application/rss+xml; charset=utf-8'}
+            if self.validators:
+                response_headers.update({'ETag': ETAG, 'Last-Modified': LAST_MODIFIED})
+            response = FakeResponse(200, (FIXTURES / "sample_rss_feed.xml").read_bytes(), response_headers)
+        self.responses.append(response)
+        return response
+
+    async def close(self):
+        self.closed = True
+
+
+def make_collector(tmp_path, session):
+    config_path = tmp_path / "news_sources.json"
+    config_path.write_text(json.dumps(SOURCES), encoding='utf-8')
+    collector = NewsCollector(str(config_path), cache_path=str(tmp_path / "data" / "news_feed_cache.json"))
+    collector._create_session = lambda: session
+    return collector
+
+
+def collect(collector):
+    # Far enough back that the fixture's articles are never too old
+    return asyncio.run(collector.collect_all_news(hours_back=24 * 365 * 100))
+
+
+def test_unchanged_feed_is_served_from_cache_on_the_next_run(tmp_path):
+    first_session = FakeSession()
+    first = collect(make_collector(tmp_path, first_session))
+
+    assert first_session.requests == [(FEED_URL, {})]
+    assert first['total_articles'] == 2
+
+    # A new collector, as on the next scheduled run, reads the cache from disk
+    second_session = FakeSession()
+    second = collect(make_collector(tmp_path, second_session))
+
+    _, headers = second_session.requests[0]
+    assert headers == {'If-None-Match': ETAG, 'If-Modified-Since': LAST_MODIFIED}
+    assert second_session.responses[0].status == 304
+    assert second_session.responses[0].read_count == 0
+    assert second['articles'] == first['articles']
+
+
+def test_feed_without_validators_is_not_cached(tmp_path):
+    collector = make_collector(tmp_path, FakeSession(validators=False))
+
+    assert collect(collector)['total_articles'] == 2
+    assert json.loads(collector.cache_path.read_text(encoding='utf-8')) == {}
+
+
+def test_feeds_no_longer_configured_are_evicted(tmp_path):
+    collector = make_collector(tmp_path, FakeSession())
+    collector.cache_path.parent.mkdir(parents=True)
+    stale = {'etag': '"old"', 'last_modified': None, 'entries': []}
+    collector.cache_path.write_text(json.dumps({"https://example.com/removed.rss": stale}), encoding='utf-8')
+
+    collect(collector)
+
+    assert list(json.loads(collector.cache_path.read_text(encoding='utf-8'))) == [FEED_URL]
+
+
+def test_unreadable_cache_is_ignored(tmp_path, caplog):
+    session = FakeSession()
+    collector = make_collector(tmp_path, session)
+    collector.cache_path.parent.mkdir(parents=True)
+    collector.cache_path.write_text("{not json", encoding='utf-8')
+
+    with caplog.at_level(logging.WARNING):
+        result = collect(collector)
+
+    assert "News feed cache read failed" in caplog.text
+    assert session.requests == [(FEED_URL, {})]
+    assert result['total_articles'] == 2
+
+
+def test_cache_write_failure_does_not_fail_collection(tmp_path, caplog):
+    collector = make_collector(tmp_path, FakeSession())
+    # A file where the cache directory should be
+    collector.cache_path.parent.write_text("", encoding='utf-8')
+
+    with caplog.at_level(logging.WARNING):
+        result = collect(collector)
+
+    assert "News feed cache write failed" in caplog.text
+    assert result['total_articles'] == 2
+
+
+def test_articles_are_built_from_feed_entries(tmp_path):
+    result = collect(make_collector(tmp_path, FakeSession()))
+
+    school, power = result['articles']['norwegian_local']
+    assert school['description'] == 'Elevene flytter inn etter høstferien. Kommunen er fornøyd.'
+    assert school['published_timestamp'] == datetime(2026, 10, 15, 5, 30, tzinfo=timezone.utc).timestamp()
+    assert school['category'] == 'local'
+    assert school['language'] == 'norwegian'
+    assert school['priority_score'] == 3
+    assert power['category'] == 'economy'
+
+
+@pytest.mark.parametrize('text, category', [
+    ('Ny AI-modell fra NTNU-forskere', 'local'),
+    ('Ny AI-modell lansert', 'technology'),
+    ('Han sa det var for sent', 'general'),
+    ('SP vil ha ny leder', 'politics'),
+    ('Spania vant finalen', 'general'),
+])
+def test_short_keywords_match_whole_words_only(tmp_path, text, category):
+    collector = make_collector(tmp_path, FakeSession())
+
+    assert collector._categorize_article({'title': text}) == category
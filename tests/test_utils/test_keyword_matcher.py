@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from src.collectors import calendar_collector, medium_collector
+from src.utils import keyword_matcher
+from src.utils.keyword_matcher import build_keyword_matcher, keyword_pattern
+
+FILLER_ALPHABET = 'abcdeiklmnoprstuøæå -'
+
+# Overlapping and nested keywords on top of the real ones
+TRICKY_KEYWORDS = frozenset({'ai', 'ai ml', 'learn', 'learning', 'machine learning', 'earn', 'ing'})
+
+
+def random_texts(words, count=500, seed=0):
+    """Texts built from keywords, keyword fragments and filler, so hits overlap and nest"""
+    rng = random.Random(seed)
+    words = sorted(words)
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(0, 6)):
+            word = rng.choice(words)
+            kind = rng.random()
+            if kind < 0.4:
+                parts.append(word)
+            elif kind < 0.7:
+                start = rng.randrange(len(word))
+                parts.append(word[start:rng.randint(start + 1, len(word))])
+            else:
+                parts.append(''.join(rng.choice(FILLER_ALPHABET) for _ in range(rng.randint(1, 8))))
+        yield rng.choice(['', ' ']).join(parts)
+
+
+@pytest.fixture(params=[
+    pytest.param('ahocorasick', marks=pytest.mark.skipif(
+        keyword_matcher.ahocorasick is None, reason="pyahocorasick not installed")),
+    'regex',
+])
+def backend(request, monkeypatch):
+    if request.param == 'regex':
+        monkeypatch.setattr(keyword_matcher, 'ahocorasick', None)
+    return request.param
+
+
+def test_grouped_matcher_matches_substring_checks(backend):
+    groups = dict(calendar_collector.KEYWORD_GROUPS, tricky=TRICKY_KEYWORDS)
+    match = build_keyword_matcher(groups)
+
+    for text in random_texts(set().union(*groups.values())):
+        expected = frozenset(group for group, words in groups.items() if any(word in text for word in words))
+        assert match(text) == expected, text
+
+
+def test_per_keyword_matcher_matches_substring_checks(backend):
+    keywords = (
+        medium_collector.HIGH_VALUE_KEYWORDS.keys() | medium_collector.MEDIUM_VALUE_KEYWORDS.keys()
+        | medium_collector.PRACTICAL_INDICATORS | medium_collector.BEGINNER_INDICATORS
+        | medium_collector.ADVANCED_INDICATORS | TRICKY_KEYWORDS
+    )
+    match = build_keyword_matcher({keyword: (keyword,) for keyword in keywords})
+
+    for text in random_texts(keywords):
+        assert match(text) == frozenset(k for k in keywords if k in text), text
+
+
+def test_keyword_pattern_matches_case_insensitive_substring_checks():
+    keywords = ['newsletter', 'news@', 'no-reply', 'noreply', 'update', 'updates@', 'issue #']
+    rng = random.Random(0)
+    pattern = keyword_pattern(keywords, ignore_case=True)
+    for _ in range(500):
+        parts = [
+            rng.choice(keywords)[rng.randrange(3):] if rng.random() < 0.5
+            else ''.join(rng.choice('aeinoprstuwy@#- ') for _ in range(rng.randint(1, 6)))
+            for _ in range(rng.randint(0, 5))
+        ]
+        text = ''.join(part.upper() if rng.random() < 0.3 else part for part in parts)
+        expected = any(keyword in text.lower() for keyword in keywords)
+        assert (pattern.search(text) is not None) == expected, text
+
+
+def test_keyword_pattern_is_case_sensitive_by_default():
+    assert keyword_pattern(['update']).search('UPDATE') is None
+
+
+def test_keyword_pattern_requires_whole_words_for_short_keywords():
+    pattern = keyword_pattern(['ai', 'skole'], whole_word_max_len=3)
+
+    assert pattern.search('said') is None
+    assert pattern.search('ny ai-modell') is not None
+    assert pattern.search('barneskole') is not None